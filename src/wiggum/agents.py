@@ -56,7 +56,7 @@ def get_cli_error_message(cli_name: str) -> str:
     return f"Error: '{cli_name}' command not found. Please install it and try again."
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentResult:
     """Result from running an agent."""
 
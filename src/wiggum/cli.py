@@ -14,6 +14,7 @@ from wiggum.agents import (
 )
 from wiggum.config import (
     CONFIG_FILE,
+    ResolvedRunConfig,
     read_config,
     resolve_run_config,
     resolve_templates_dir,
@@ -163,6 +164,47 @@ def _build_dry_run_command(
     return cmd
 
 
+def _format_dry_run(cfg: ResolvedRunConfig, agent_name: str, prompt: str) -> str:
+    """Build the --dry-run summary of what the run command would do."""
+    cmd = _build_dry_run_command(agent_name, cfg.yolo, cfg.allow_paths)
+    lines = [
+        f"Would run {cfg.max_iterations} iterations",
+        f"Agent: {agent_name}",
+    ]
+    if cfg.model:
+        lines.append(f"Model: {cfg.model}")
+    lines.append(f"Timeout: {cfg.timeout}s per iteration")
+    lines.append(f"Command: {' '.join(cmd)}")
+    lines.append(f"Stop condition: tasks (check {cfg.tasks_file})")
+    if cfg.keep_running:
+        lines.append("Task completion mode: keep running (continue for all iterations)")
+    else:
+        lines.append("Task completion mode: stop when done (exit when tasks complete)")
+    if cfg.continue_session:
+        lines.append(
+            "Session mode: continue (will pass -c to claude after first iteration)"
+        )
+    else:
+        lines.append("Session mode: reset (fresh session each iteration)")
+    if cfg.log_file:
+        lines.append(f"Log file: {cfg.log_file}")
+    if cfg.show_progress:
+        lines.append(
+            "Progress tracking: enabled (will show file changes via git status)"
+        )
+    if cfg.no_branch:
+        lines.append("Git safety: disabled (--no-branch)")
+    elif cfg.force:
+        lines.append("Git safety: disabled (--force)")
+    else:
+        lines.append("Git safety: enabled (will create branch in git repos)")
+    if cfg.create_pr:
+        lines.append("PR creation: enabled (will create PR after loop)")
+    lines.append(f"Branch prefix: {cfg.branch_prefix}")
+    lines.append(f"Prompt:\n---\n{prompt}\n---")
+    return "\n".join(lines)
+
+
 @app.command()
 def run(
     prompt_file: Optional[Path] = typer.Option(
@@ -357,44 +399,7 @@ def run(
             raise typer.Exit(1)
 
     if dry_run:
-        cmd = _build_dry_run_command(agent_name, cfg.yolo, cfg.allow_paths)
-        typer.echo(f"Would run {cfg.max_iterations} iterations")
-        typer.echo(f"Agent: {agent_name}")
-        if cfg.model:
-            typer.echo(f"Model: {cfg.model}")
-        typer.echo(f"Timeout: {cfg.timeout}s per iteration")
-        typer.echo(f"Command: {' '.join(cmd)}")
-        typer.echo(f"Stop condition: tasks (check {cfg.tasks_file})")
-        if cfg.keep_running:
-            typer.echo(
-                "Task completion mode: keep running (continue for all iterations)"
-            )
-        else:
-            typer.echo(
-                "Task completion mode: stop when done (exit when tasks complete)"
-            )
-        if cfg.continue_session:
-            typer.echo(
-                "Session mode: continue (will pass -c to claude after first iteration)"
-            )
-        else:
-            typer.echo("Session mode: reset (fresh session each iteration)")
-        if cfg.log_file:
-            typer.echo(f"Log file: {cfg.log_file}")
-        if cfg.show_progress:
-            typer.echo(
-                "Progress tracking: enabled (will show file changes via git status)"
-            )
-        if cfg.no_branch:
-            typer.echo("Git safety: disabled (--no-branch)")
-        elif cfg.force:
-            typer.echo("Git safety: disabled (--force)")
-        else:
-            typer.echo("Git safety: enabled (will create branch in git repos)")
-        if cfg.create_pr:
-            typer.echo("PR creation: enabled (will create PR after loop)")
-        typer.echo(f"Branch prefix: {cfg.branch_prefix}")
-        typer.echo(f"Prompt:\n---\n{prompt}\n---")
+        typer.echo(_format_dry_run(cfg, agent_name, prompt))
         return
 
     # Validate agent CLI is available before running
@@ -629,6 +634,23 @@ def run(
             typer.echo(f"  Discard:    git checkout main && git branch -D {current}")
 
 
+def _build_init_config(yolo: bool, allow_paths: str, git_enabled: bool) -> dict:
+    """Build the .wiggum.toml contents written by init from the user's answers."""
+    return {
+        "security": {
+            "yolo": yolo,
+            "allow_paths": allow_paths,
+        },
+        "loop": {
+            "max_iterations": 10,
+            "timeout": 1800,
+        },
+        "git": {
+            "enabled": git_enabled,
+        },
+    }
+
+
 @app.command()
 def init(
     force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing files"),
@@ -792,21 +814,7 @@ def init(
     git_enabled = typer.confirm("Enable git workflow?", default=False)
 
     # Write config with security, loop, and git settings
-    write_config(
-        {
-            "security": {
-                "yolo": security_yolo,
-                "allow_paths": security_allow_paths,
-            },
-            "loop": {
-                "max_iterations": 10,
-                "timeout": 1800,
-            },
-            "git": {
-                "enabled": git_enabled,
-            },
-        }
-    )
+    write_config(_build_init_config(security_yolo, security_allow_paths, git_enabled))
 
     # Generate files from templates
     prompt_template = prompt_template_path.read_text()
@@ -848,7 +856,9 @@ def init(
     gitignore_path = Path(".gitignore")
     wiggum_entries = [".wiggum/", "LOOP-PROMPT.md", ".wiggum.toml"]
     gitignore_content = gitignore_path.read_text() if gitignore_path.exists() else ""
-    missing = [e for e in wiggum_entries if e not in gitignore_content]
+    # Match whole lines so e.g. "build/.wiggum/" doesn't count as ".wiggum/"
+    present = {line.strip() for line in gitignore_content.splitlines()}
+    missing = [e for e in wiggum_entries if e not in present]
     if missing:
         section = "\n# wiggum\n" + "\n".join(missing) + "\n"
         gitignore_path.write_text(gitignore_content.rstrip() + section)
@@ -1161,8 +1171,6 @@ def upgrade(
         wiggum upgrade config    # Only upgrade .wiggum.toml
         wiggum upgrade tasks     # Only upgrade TODO.md structure
     """
-    import tomli_w
-
     from wiggum import __version__ as current_version
     from wiggum.upgrade import (
         add_missing_task_sections,
@@ -1299,7 +1307,7 @@ def upgrade(
 
     if upgrade_config and missing_options:
         merged = merge_config_with_defaults(existing_config)
-        config_path.write_text(tomli_w.dumps(merged))
+        write_config(merged)
         typer.echo("✓ .wiggum.toml updated with new options")
 
     if upgrade_tasks and tasks_outdated and tasks_content is not None:
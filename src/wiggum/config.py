@@ -1,5 +1,7 @@
 """Configuration handling for wiggum."""
 
+import copy
+import functools
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -385,9 +387,27 @@ def resolve_run_config(
     )
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_config(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a TOML config file, memoized by path and file version.
+
+    The mtime and size arguments are only part of the cache key: a
+    modified file gets a new key and is re-parsed on the next read.
+    """
+    try:
+        import tomllib
+    except ImportError:
+        import tomli as tomllib
+
+    return tomllib.loads(Path(path).read_bytes().decode("utf-8"))
+
+
 def read_config() -> dict:
     """Read configuration from .wiggum.toml.
 
+    Parsed configs are cached per (path, mtime, size), so repeated reads of
+    an unchanged file skip parsing. Each call returns a fresh copy.
+
     Returns:
         Configuration dict with 'security' section containing 'yolo' and 'allow_paths'.
         Returns empty dict if file doesn't exist.
@@ -397,12 +417,11 @@ def read_config() -> dict:
         return {}
 
     try:
-        try:
-            import tomllib
-        except ImportError:
-            import tomli as tomllib
-
-        return tomllib.loads(config_path.read_text())
+        stat = config_path.stat()
+        config = _parse_config(
+            str(config_path.resolve()), stat.st_mtime_ns, stat.st_size
+        )
+        return copy.deepcopy(config)
     except Exception:
         return {}
 
@@ -416,11 +435,17 @@ def write_config(config: dict) -> None:
     import tomli_w
 
     config_path = Path(CONFIG_FILE)
-    config_path.write_text(tomli_w.dumps(config))
+    config_path.write_bytes(tomli_w.dumps(config).encode("utf-8"))
+    _parse_config.cache_clear()
 
 
+@functools.cache
 def get_templates_dir() -> Path:
-    """Get the templates directory from the package."""
+    """Get the templates directory from the package.
+
+    The package location is fixed for the life of the process, so the
+    lookup is done once.
+    """
     import importlib.resources
 
     return Path(str(importlib.resources.files("wiggum"))) / "templates"
@@ -8,7 +8,8 @@ These tests verify that all agents (claude, codex, gemini):
 """
 
 import subprocess
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -31,6 +32,26 @@ AGENT_TEST_DATA = [
     ("gemini", GeminiAgent, "wiggum.agents_gemini.subprocess.run"),
 ]
 
+# Map agent classes to their subprocess module paths and agent-specific flags
+AGENT_FLAG_DATA = [
+    (
+        ClaudeAgent,
+        "wiggum.agents_claude.subprocess.run",
+        "--dangerously-skip-permissions",
+        "--allowedTools",
+    ),
+    (CodexAgent, "wiggum.agents_codex.subprocess.run", "--yolo", "--add-dir"),
+    (
+        GeminiAgent,
+        "wiggum.agents_gemini.subprocess.run",
+        "--yolo",
+        "--include-directories",
+    ),
+]
+
+# Shared read-only config for tests that don't vary any agent options
+BASIC_CONFIG = AgentConfig(prompt="test")
+
 
 @pytest.mark.parametrize(
     "name,agent_class,_", AGENT_TEST_DATA, ids=["claude", "codex", "gemini"]
@@ -63,79 +84,102 @@ class TestAgentProtocol:
 class TestAgentResult:
     """Tests that all agents return correct AgentResult from run()."""
 
-    def test_returns_agent_result(
-        self, name: str, agent_class: type, subprocess_path: str
+    @pytest.mark.parametrize(
+        "stdout,stderr,returncode,expected",
+        [
+            ("hello world", "", 0, ("hello world", "", 0)),
+            ("", "error msg", 1, ("", "error msg", 1)),
+            ("", "", 42, ("", "", 42)),
+            (None, "", 0, ("", "", 0)),
+            ("", None, 0, ("", "", 0)),
+        ],
+        ids=["stdout", "stderr", "return-code", "none-stdout", "none-stderr"],
+    )
+    def test_captures_subprocess_result(
+        self,
+        name: str,
+        agent_class: type,
+        subprocess_path: str,
+        stdout: str | None,
+        stderr: str | None,
+        returncode: int,
+        expected: tuple[str, str, int],
     ):
-        """run() should return an AgentResult."""
-        with patch(subprocess_path) as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout="output", stderr="err", returncode=0
-            )
-            agent = agent_class()
-            result = agent.run(AgentConfig(prompt="test"))
-            assert isinstance(result, AgentResult)
+        """run() should return an AgentResult mirroring the subprocess output.
 
-    def test_captures_stdout(self, name: str, agent_class: type, subprocess_path: str):
-        """Result should contain stdout from subprocess."""
-        with patch(subprocess_path) as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout="hello world", stderr="", returncode=0
-            )
-            agent = agent_class()
-            result = agent.run(AgentConfig(prompt="test"))
-            assert result.stdout == "hello world"
-
-    def test_captures_stderr(self, name: str, agent_class: type, subprocess_path: str):
-        """Result should contain stderr from subprocess."""
-        with patch(subprocess_path) as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout="", stderr="error msg", returncode=1
+        None stdout/stderr should be normalized to empty strings.
+        """
+        with patch(subprocess_path, new_callable=Mock) as mock_run:
+            mock_run.return_value = SimpleNamespace(
+                stdout=stdout, stderr=stderr, returncode=returncode
             )
             agent = agent_class()
-            result = agent.run(AgentConfig(prompt="test"))
-            assert result.stderr == "error msg"
-
-    def test_captures_return_code(
-        self, name: str, agent_class: type, subprocess_path: str
-    ):
-        """Result should contain return code from subprocess."""
-        with patch(subprocess_path) as mock_run:
-            mock_run.return_value = MagicMock(stdout="", stderr="", returncode=42)
-            agent = agent_class()
-            result = agent.run(AgentConfig(prompt="test"))
-            assert result.return_code == 42
-
-    def test_handles_none_stdout(
-        self, name: str, agent_class: type, subprocess_path: str
-    ):
-        """Result should handle None stdout gracefully."""
-        with patch(subprocess_path) as mock_run:
-            mock_run.return_value = MagicMock(stdout=None, stderr="", returncode=0)
-            agent = agent_class()
-            result = agent.run(AgentConfig(prompt="test"))
-            assert result.stdout == ""
-
-    def test_handles_none_stderr(
-        self, name: str, agent_class: type, subprocess_path: str
-    ):
-        """Result should handle None stderr gracefully."""
-        with patch(subprocess_path) as mock_run:
-            mock_run.return_value = MagicMock(stdout="", stderr=None, returncode=0)
-            agent = agent_class()
-            result = agent.run(AgentConfig(prompt="test"))
-            assert result.stderr == ""
+            result = agent.run(BASIC_CONFIG)
+            assert isinstance(result, AgentResult)
+            assert (result.stdout, result.stderr, result.return_code) == expected
 
     def test_passes_timeout_to_subprocess(
         self, name: str, agent_class: type, subprocess_path: str
     ):
         """run() should pass timeout_seconds to subprocess.run."""
-        with patch(subprocess_path) as mock_run:
-            mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
+        with patch(subprocess_path, new_callable=Mock) as mock_run:
+            mock_run.return_value = SimpleNamespace(stdout="", stderr="", returncode=0)
             agent = agent_class()
             agent.run(AgentConfig(prompt="test", timeout_seconds=42))
             assert mock_run.call_args.kwargs["timeout"] == 42
 
 
+@pytest.mark.parametrize(
+    "agent_class,subprocess_path,yolo_flag,allow_paths_flag",
+    AGENT_FLAG_DATA,
+    ids=["claude", "codex", "gemini"],
+)
+class TestAgentCommandFlags:
+    """Tests that all agents map config options to their CLI flags."""
+
+    def test_yolo_mode_adds_flag(
+        self,
+        agent_class: type,
+        subprocess_path: str,
+        yolo_flag: str,
+        allow_paths_flag: str,
+    ):
+        """yolo=True should add the agent's yolo flag."""
+        with patch(subprocess_path, new_callable=Mock) as mock_run:
+            mock_run.return_value = SimpleNamespace(stdout="", stderr="", returncode=0)
+            agent_class().run(AgentConfig(prompt="test", yolo=True))
+            cmd = mock_run.call_args.args[0]
+            assert yolo_flag in cmd
+
+    def test_yolo_false_no_flag(
+        self,
+        agent_class: type,
+        subprocess_path: str,
+        yolo_flag: str,
+        allow_paths_flag: str,
+    ):
+        """yolo=False should not add the agent's yolo flag."""
+        with patch(subprocess_path, new_callable=Mock) as mock_run:
+            mock_run.return_value = SimpleNamespace(stdout="", stderr="", returncode=0)
+            agent_class().run(AgentConfig(prompt="test", yolo=False))
+            cmd = mock_run.call_args.args[0]
+            assert yolo_flag not in cmd
+
+    def test_allow_paths_none_no_flag(
+        self,
+        agent_class: type,
+        subprocess_path: str,
+        yolo_flag: str,
+        allow_paths_flag: str,
+    ):
+        """allow_paths=None should not add the agent's path flag."""
+        with patch(subprocess_path, new_callable=Mock) as mock_run:
+            mock_run.return_value = SimpleNamespace(stdout="", stderr="", returncode=0)
+            agent_class().run(AgentConfig(prompt="test", allow_paths=None))
+            cmd = mock_run.call_args.args[0]
+            assert allow_paths_flag not in cmd
+
+
 @pytest.mark.parametrize(
     "name,agent_class,subprocess_path",
     AGENT_TEST_DATA,
@@ -148,12 +192,10 @@ class TestAgentErrorHandling:
         self, name: str, agent_class: type, subprocess_path: str
     ):
         """Should return error result when command is not found."""
-        with patch(subprocess_path) as mock_run:
-            mock_run.side_effect = FileNotFoundError(
-                f"No such file or directory: '{name}'"
-            )
+        with patch(subprocess_path, new_callable=Mock) as mock_run:
+            mock_run.side_effect = FileNotFoundError
             agent = agent_class()
-            result = agent.run(AgentConfig(prompt="test"))
+            result = agent.run(BASIC_CONFIG)
             assert result.return_code == 1
             assert "not found" in result.stderr.lower()
             assert result.stdout == ""
@@ -162,7 +204,7 @@ class TestAgentErrorHandling:
         self, name: str, agent_class: type, subprocess_path: str
     ):
         """Should return timeout error result when subprocess exceeds timeout."""
-        with patch(subprocess_path) as mock_run:
+        with patch(subprocess_path, new_callable=Mock) as mock_run:
             mock_run.side_effect = subprocess.TimeoutExpired(cmd=name, timeout=5)
             agent = agent_class()
             result = agent.run(AgentConfig(prompt="test", timeout_seconds=5))
@@ -9,12 +9,8 @@ These tests verify that:
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from typer.testing import CliRunner
-
+from tests.helpers import cli, runner
 from wiggum.agents import AgentConfig, AgentResult
-from wiggum.cli import app
-
-runner = CliRunner()
 
 
 class TestCliUsesAgentAbstraction:
@@ -43,7 +39,7 @@ class TestCliUsesAgentAbstraction:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -82,7 +78,7 @@ class TestCliUsesAgentAbstraction:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -98,7 +94,7 @@ class TestCliUsesAgentAbstraction:
         assert result.exit_code == 0
         mock_agent.run.assert_called_once()
         # Verify it was called with AgentConfig
-        call_args = mock_agent.run.call_args[0][0]
+        call_args = mock_agent.run.call_args.args[0]
         assert isinstance(call_args, AgentConfig)
 
     def test_agent_config_has_correct_prompt(self, tmp_path: Path) -> None:
@@ -124,7 +120,7 @@ class TestCliUsesAgentAbstraction:
 
 
                 runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -137,7 +133,7 @@ class TestCliUsesAgentAbstraction:
                 ],
             )
 
-        config = mock_agent.run.call_args[0][0]
+        config = mock_agent.run.call_args.args[0]
         assert config.prompt == "my special prompt"
 
     def test_agent_config_has_yolo_setting(self, tmp_path: Path) -> None:
@@ -163,7 +159,7 @@ class TestCliUsesAgentAbstraction:
 
 
                 runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -178,7 +174,7 @@ class TestCliUsesAgentAbstraction:
                 ],
             )
 
-        config = mock_agent.run.call_args[0][0]
+        config = mock_agent.run.call_args.args[0]
         assert config.yolo is True
 
     def test_agent_config_has_allow_paths_setting(self, tmp_path: Path) -> None:
@@ -204,7 +200,7 @@ class TestCliUsesAgentAbstraction:
 
 
                 runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -220,7 +216,7 @@ class TestCliUsesAgentAbstraction:
                 ],
             )
 
-        config = mock_agent.run.call_args[0][0]
+        config = mock_agent.run.call_args.args[0]
         assert config.allow_paths == "src/,tests/"
 
     def test_agent_config_has_timeout_setting(self, tmp_path: Path) -> None:
@@ -244,7 +240,7 @@ class TestCliUsesAgentAbstraction:
             with patch("wiggum.cli.get_agent", return_value=mock_agent):
 
                 runner.invoke(
-                    app,
+                    cli,
                     [
                         "run",
                         "-f",
@@ -260,7 +256,7 @@ class TestCliUsesAgentAbstraction:
                     ],
                 )
 
-        config = mock_agent.run.call_args[0][0]
+        config = mock_agent.run.call_args.args[0]
         assert config.timeout_seconds == 25
 
     def test_agent_config_continue_session_on_subsequent_iterations(
@@ -298,7 +294,7 @@ class TestCliUsesAgentAbstraction:
 
 
                 runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -313,9 +309,9 @@ class TestCliUsesAgentAbstraction:
             )
 
         # First call: continue_session should be False
-        first_config = mock_agent.run.call_args_list[0][0][0]
+        first_config = mock_agent.run.call_args_list[0].args[0]
         assert first_config.continue_session is False
 
         # Second call: continue_session should be True
-        second_config = mock_agent.run.call_args_list[1][0][0]
+        second_config = mock_agent.run.call_args_list[1].args[0]
         assert second_config.continue_session is True
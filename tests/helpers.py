@@ -0,0 +1,15 @@
+"""Shared helpers for CLI tests."""
+
+from types import SimpleNamespace
+
+import typer
+from click.testing import CliRunner
+
+from wiggum.cli import app
+
+runner = CliRunner()
+# Build the click command once; typer's CliRunner rebuilds it on every invoke
+cli = typer.main.get_command(app)
+
+# Successful subprocess.run result for the mocked agent CLI
+COMPLETED = SimpleNamespace(returncode=0, stdout="", stderr="")
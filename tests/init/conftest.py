@@ -0,0 +1,47 @@
+"""Shared fixtures for init command tests."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+# Minimal templates init needs, keyed by file name
+TEMPLATES = {
+    "LOOP-PROMPT.md": "## Goal\n\n{{goal}}\n\n## Workflow\n",
+    "TODO.md": "# Tasks\n\n## Todo\n\n{{tasks}}\n",
+    "META-PROMPT.md": "Analyze {{goal}}{{existing_tasks}}",
+}
+
+
+@pytest.fixture(scope="session")
+def template_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """TEMPLATES written once per session.
+
+    init only reads templates, so every test symlinks templates/ to this
+    directory inside its working directory.
+    """
+    path = tmp_path_factory.mktemp("templates")
+    for name, content in TEMPLATES.items():
+        (path / name).write_text(content)
+    return path
+
+
+@pytest.fixture
+def mock_claude(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace the planning call init --suggest makes with a Mock.
+
+    Tests set return_value (an (output, error) tuple) or side_effect on it.
+    """
+    mock = Mock()
+    monkeypatch.setattr("wiggum.runner.run_claude_for_planning", mock)
+    return mock
+
+
+@pytest.fixture
+def init_fs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, template_dir: Path
+) -> Path:
+    """Chdir into tmp_path with templates/ linked to template_dir."""
+    monkeypatch.chdir(tmp_path)
+    Path("templates").symlink_to(template_dir)
+    return tmp_path
@@ -2,98 +2,49 @@
 
 from pathlib import Path
 
-from typer.testing import CliRunner
+import pytest
 
-from wiggum.cli import app
-from wiggum.config import read_config
-
-runner = CliRunner()
+from tests.helpers import cli, runner
+from wiggum.cli import _build_init_config
+from wiggum.config import write_config
 
 
 class TestInitWritesDefaultLoopConfig:
     """Tests for init writing default [loop] configuration."""
 
-    def test_init_writes_default_max_iterations(self, tmp_path: Path) -> None:
-        """Init writes default max_iterations to config file."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "LOOP-PROMPT.md").write_text(
-                "## Goal\n\n{{goal}}\n\n## Workflow\n"
-            )
-            (Path("templates") / "TODO.md").write_text(
-                "# Tasks\n\n## Todo\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "META-PROMPT.md").write_text("Analyze {{goal}}")
-
-            # doc files, task, empty, security (1), git (n)
-            result = runner.invoke(
-                app,
-                ["init"],
-                input="README.md\nTask 1\n\n1\nn\n",
-            )
-
-            assert result.exit_code == 0, f"Init failed: {result.output}"
+    def test_build_init_config_default_max_iterations(self) -> None:
+        """The init config defaults max_iterations to 10."""
+        config = _build_init_config(yolo=False, allow_paths="", git_enabled=False)
 
-            config = read_config()
-            assert "loop" in config, "Config should have [loop] section"
-            assert "max_iterations" in config["loop"], (
-                "Config should have max_iterations in [loop] section"
-            )
-            assert config["loop"]["max_iterations"] == 10, (
-                "Default max_iterations should be 10"
-            )
+        assert config["loop"]["max_iterations"] == 10, (
+            "Default max_iterations should be 10"
+        )
 
-    def test_init_writes_loop_section_with_security(self, tmp_path: Path) -> None:
+    def test_init_writes_loop_section_with_security(self, init_fs: Path) -> None:
         """Init writes both [security] and [loop] sections."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "LOOP-PROMPT.md").write_text(
-                "## Goal\n\n{{goal}}\n\n## Workflow\n"
-            )
-            (Path("templates") / "TODO.md").write_text(
-                "# Tasks\n\n## Todo\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "META-PROMPT.md").write_text("Analyze {{goal}}")
-
-            # doc files, task, empty, yolo mode (3), git (y)
-            result = runner.invoke(
-                app,
-                ["init"],
-                input="README.md\nTask 1\n\n3\ny\n",
-            )
-
-            assert result.exit_code == 0, f"Init failed: {result.output}"
+        # doc files, task, empty, yolo mode (3), git (y)
+        result = runner.invoke(
+            cli,
+            ["init"],
+            input="README.md\nTask 1\n\n3\ny\n",
+        )
 
-            config_file = Path(".wiggum.toml")
-            content = config_file.read_text()
+        assert result.exit_code == 0, f"Init failed: {result.output}"
 
-            # Should have all sections
-            assert "[security]" in content
-            assert "[loop]" in content
-            assert "[git]" in content
-            assert "max_iterations" in content
+        lines = set(Path(".wiggum.toml").read_text().splitlines())
 
-    def test_config_file_format_readable(self, tmp_path: Path) -> None:
-        """Config file is human-readable with expected format."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "LOOP-PROMPT.md").write_text(
-                "## Goal\n\n{{goal}}\n\n## Workflow\n"
-            )
-            (Path("templates") / "TODO.md").write_text(
-                "# Tasks\n\n## Todo\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "META-PROMPT.md").write_text("Analyze {{goal}}")
+        # Should have all sections
+        assert {"[security]", "[loop]", "[git]"} <= lines
+        assert "max_iterations = 10" in lines
 
-            # doc files, task, empty, security (1), git (n)
-            result = runner.invoke(
-                app,
-                ["init"],
-                input="README.md\nTask 1\n\n1\nn\n",
-            )
+    def test_write_config_formats_init_defaults(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """write_config writes the init defaults as readable key = value lines."""
+        monkeypatch.chdir(tmp_path)
 
-            assert result.exit_code == 0
+        write_config(_build_init_config(yolo=False, allow_paths="", git_enabled=False))
 
-            content = Path(".wiggum.toml").read_text()
-            # Should have the expected format
-            assert "max_iterations = 10" in content
+        lines = (tmp_path / ".wiggum.toml").read_text().splitlines()
+        # Should have the expected format
+        assert "max_iterations = 10" in lines
@@ -1,46 +1,39 @@
 """Tests for init command merging tasks when TODO.md exists."""
 
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock
 
-from typer.testing import CliRunner
+import pytest
 
-from wiggum.cli import app
+from tests.helpers import cli, runner
 
-runner = CliRunner()
+
+@pytest.fixture
+def merge_project(init_fs: Path) -> Path:
+    """init_fs with a README for context."""
+    Path("README.md").write_text("# Test Project\n\nThis is a test.")
+    return init_fs
 
 
 class TestInitMergesTasks:
     """Tests for init command updating TODO.md when it already exists."""
 
-    def test_init_merges_tasks_when_tasks_file_exists(self, tmp_path: Path) -> None:
+    def test_init_merges_tasks_when_tasks_file_exists(
+        self, merge_project: Path, mock_claude: Mock
+    ) -> None:
         """Init adds new tasks to existing TODO.md instead of failing."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Create templates
-            Path("templates").mkdir()
-            (Path("templates") / "LOOP-PROMPT.md").write_text(
-                "## Goal\n\n{{goal}}\n\n## Tasks\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "TODO.md").write_text(
-                "# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "META-PROMPT.md").write_text("Analyze {{goal}}")
-
-            # Create README so goal is inferred
-            Path("README.md").write_text("# Test Project\n\nThis is a test.")
-
-            # Create existing TODO.md with some tasks
-            Path("TODO.md").write_text(
-                "# Tasks\n\n"
-                "## Done\n\n"
-                "- [x] Previously completed task\n\n"
-                "## In Progress\n\n"
-                "## Todo\n\n"
-                "- [ ] Existing todo task\n"
-            )
-
-            # Mock Claude to return suggestions
-            mock_output = """```markdown
+        # Create existing TODO.md with some tasks
+        Path("TODO.md").write_text(
+            "# Tasks\n\n"
+            "## Done\n\n"
+            "- [x] Previously completed task\n\n"
+            "## In Progress\n\n"
+            "## Todo\n\n"
+            "- [ ] Existing todo task\n"
+        )
+
+        # Mock Claude to return suggestions
+        mock_output = """```markdown
 ## Goal
 
 Test goal
@@ -50,52 +43,37 @@ Test goal
 - [ ] New task from Claude
 - [ ] Another new task
 ```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                # Accept Claude's suggestions, conservative security, git (n)
-                result = runner.invoke(
-                    app,
-                    ["init", "--suggest"],
-                    input="y\n1\nn\n",
-                )
-
-            # Should succeed without --force
-            assert result.exit_code == 0, f"Expected success. Output: {result.output}"
-
-            # Existing tasks should be preserved
-            content = Path("TODO.md").read_text()
-            assert "- [x] Previously completed task" in content
-            assert "- [ ] Existing todo task" in content
-
-            # New tasks should be added
-            assert "- [ ] New task from Claude" in content
-            assert "- [ ] Another new task" in content
-
-    def test_init_does_not_duplicate_existing_tasks(self, tmp_path: Path) -> None:
+        mock_claude.return_value = (mock_output, None)
+        # Accept Claude's suggestions, conservative security, git (n)
+        result = runner.invoke(
+            cli,
+            ["init", "--suggest"],
+            input="y\n1\nn\n",
+        )
+
+        # Should succeed without --force
+        assert result.exit_code == 0, f"Expected success. Output: {result.output}"
+
+        # Existing tasks should be preserved
+        content = Path("TODO.md").read_text()
+        assert "- [x] Previously completed task" in content
+        assert "- [ ] Existing todo task" in content
+
+        # New tasks should be added
+        assert "- [ ] New task from Claude" in content
+        assert "- [ ] Another new task" in content
+
+    def test_init_does_not_duplicate_existing_tasks(
+        self, merge_project: Path, mock_claude: Mock
+    ) -> None:
         """Init does not add tasks that already exist in TODO.md."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Create templates
-            Path("templates").mkdir()
-            (Path("templates") / "LOOP-PROMPT.md").write_text(
-                "## Goal\n\n{{goal}}\n\n## Tasks\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "TODO.md").write_text(
-                "# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "META-PROMPT.md").write_text("Analyze {{goal}}")
-
-            # Create README so goal is inferred
-            Path("README.md").write_text("# Test Project\n\nThis is a test.")
-
-            # Create existing TODO.md with a task
-            Path("TODO.md").write_text(
-                "# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n- [ ] Existing task\n"
-            )
-
-            # Claude suggests the same task plus a new one
-            mock_output = """```markdown
+        # Create existing TODO.md with a task
+        Path("TODO.md").write_text(
+            "# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n- [ ] Existing task\n"
+        )
+
+        # Claude suggests the same task plus a new one
+        mock_output = """```markdown
 ## Goal
 
 Test goal
@@ -105,51 +83,37 @@ Test goal
 - [ ] Existing task
 - [ ] Brand new task
 ```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["init", "--suggest"],
-                    input="y\n1\nn\n",
-                )
-
-            assert result.exit_code == 0
-
-            content = Path("TODO.md").read_text()
-            # Should have exactly one "Existing task", not duplicated
-            assert content.count("Existing task") == 1
-            # Should have the new task
-            assert "- [ ] Brand new task" in content
-
-    def test_init_preserves_done_and_in_progress_sections(self, tmp_path: Path) -> None:
+        mock_claude.return_value = (mock_output, None)
+        result = runner.invoke(
+            cli,
+            ["init", "--suggest"],
+            input="y\n1\nn\n",
+        )
+
+        assert result.exit_code == 0
+
+        content = Path("TODO.md").read_text()
+        # Should have exactly one "Existing task", not duplicated
+        assert content.count("Existing task") == 1
+        # Should have the new task
+        assert "- [ ] Brand new task" in content
+
+    def test_init_preserves_done_and_in_progress_sections(
+        self, merge_project: Path, mock_claude: Mock
+    ) -> None:
         """Init preserves Done and In Progress sections when merging."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "LOOP-PROMPT.md").write_text(
-                "## Goal\n\n{{goal}}\n\n## Tasks\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "TODO.md").write_text(
-                "# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "META-PROMPT.md").write_text("Analyze {{goal}}")
-
-            # Create README so goal is inferred
-            Path("README.md").write_text("# Test Project\n\nThis is a test.")
-
-            Path("TODO.md").write_text(
-                "# Tasks\n\n"
-                "## Done\n\n"
-                "- [x] Completed task 1\n"
-                "- [x] Completed task 2\n\n"
-                "## In Progress\n\n"
-                "- [ ] Task being worked on\n\n"
-                "## Todo\n\n"
-                "- [ ] Pending task\n"
-            )
-
-            mock_output = """```markdown
+        Path("TODO.md").write_text(
+            "# Tasks\n\n"
+            "## Done\n\n"
+            "- [x] Completed task 1\n"
+            "- [x] Completed task 2\n\n"
+            "## In Progress\n\n"
+            "- [ ] Task being worked on\n\n"
+            "## Todo\n\n"
+            "- [ ] Pending task\n"
+        )
+
+        mock_output = """```markdown
 ## Goal
 
 Test goal
@@ -158,74 +122,52 @@ Test goal
 
 - [ ] New task
 ```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["init", "--suggest"],
-                    input="y\n1\nn\n",
-                )
-
-            assert result.exit_code == 0
-
-            content = Path("TODO.md").read_text()
-            # Done section preserved
-            assert "- [x] Completed task 1" in content
-            assert "- [x] Completed task 2" in content
-            # In Progress section preserved
-            assert "- [ ] Task being worked on" in content
-            # Todo tasks preserved and new one added
-            assert "- [ ] Pending task" in content
-            assert "- [ ] New task" in content
+        mock_claude.return_value = (mock_output, None)
+        result = runner.invoke(
+            cli,
+            ["init", "--suggest"],
+            input="y\n1\nn\n",
+        )
+
+        assert result.exit_code == 0
+
+        content = Path("TODO.md").read_text()
+        # Done section preserved
+        assert "- [x] Completed task 1" in content
+        assert "- [x] Completed task 2" in content
+        # In Progress section preserved
+        assert "- [ ] Task being worked on" in content
+        # Todo tasks preserved and new one added
+        assert "- [ ] Pending task" in content
+        assert "- [ ] New task" in content
 
     def test_init_errors_if_loop_prompt_exists_without_force(
-        self, tmp_path: Path
+        self, init_fs: Path
     ) -> None:
         """Init still errors if LOOP-PROMPT.md exists (no merge for that file)."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "LOOP-PROMPT.md").write_text("## Goal\n\n{{goal}}\n")
-            (Path("templates") / "TODO.md").write_text(
-                "# Tasks\n\n## Todo\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "META-PROMPT.md").write_text("Analyze {{goal}}")
-
-            # Create existing LOOP-PROMPT.md
-            Path("LOOP-PROMPT.md").write_text("Existing loop prompt")
-
-            result = runner.invoke(
-                app,
-                ["init"],
-                input="README.md\nTask 1\n\n1\nn\n",
-            )
-
-            # Should error because LOOP-PROMPT.md exists
-            assert result.exit_code == 1
-            assert "exists" in result.output.lower() or "force" in result.output.lower()
-
-    def test_init_force_overwrites_tasks_file(self, tmp_path: Path) -> None:
+        # Create existing LOOP-PROMPT.md
+        Path("LOOP-PROMPT.md").write_text("Existing loop prompt")
+
+        result = runner.invoke(
+            cli,
+            ["init"],
+            input="README.md\nTask 1\n\n1\nn\n",
+        )
+
+        # Should error because LOOP-PROMPT.md exists
+        assert result.exit_code == 1
+        assert "exists" in result.output.lower() or "force" in result.output.lower()
+
+    def test_init_force_overwrites_tasks_file(
+        self, merge_project: Path, mock_claude: Mock
+    ) -> None:
         """With --force, init completely overwrites TODO.md."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "LOOP-PROMPT.md").write_text(
-                "## Goal\n\n{{goal}}\n\n## Tasks\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "TODO.md").write_text(
-                "# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "META-PROMPT.md").write_text("Analyze {{goal}}")
-
-            # Create README so goal is inferred
-            Path("README.md").write_text("# Test Project\n\nThis is a test.")
-
-            # Create existing TODO.md with tasks that should be overwritten
-            Path("TODO.md").write_text(
-                "# Tasks\n\n## Todo\n\n- [ ] Task to be overwritten\n"
-            )
-
-            mock_output = """```markdown
+        # Create existing TODO.md with tasks that should be overwritten
+        Path("TODO.md").write_text(
+            "# Tasks\n\n## Todo\n\n- [ ] Task to be overwritten\n"
+        )
+
+        mock_output = """```markdown
 ## Goal
 
 Test goal
@@ -234,42 +176,28 @@ Test goal
 
 - [ ] New task only
 ```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["init", "--force", "--suggest"],
-                    input="y\n1\nn\n",
-                )
-
-            assert result.exit_code == 0
-
-            content = Path("TODO.md").read_text()
-            # Old task should be gone
-            assert "Task to be overwritten" not in content
-            # Only new task should exist
-            assert "- [ ] New task only" in content
-
-    def test_init_shows_merge_message_when_updating(self, tmp_path: Path) -> None:
+        mock_claude.return_value = (mock_output, None)
+        result = runner.invoke(
+            cli,
+            ["init", "--force", "--suggest"],
+            input="y\n1\nn\n",
+        )
+
+        assert result.exit_code == 0
+
+        content = Path("TODO.md").read_text()
+        # Old task should be gone
+        assert "Task to be overwritten" not in content
+        # Only new task should exist
+        assert "- [ ] New task only" in content
+
+    def test_init_shows_merge_message_when_updating(
+        self, merge_project: Path, mock_claude: Mock
+    ) -> None:
         """Init shows a message indicating it's updating existing tasks."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "LOOP-PROMPT.md").write_text(
-                "## Goal\n\n{{goal}}\n\n## Tasks\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "TODO.md").write_text(
-                "# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "META-PROMPT.md").write_text("Analyze {{goal}}")
-
-            # Create README so goal is inferred
-            Path("README.md").write_text("# Test Project\n\nThis is a test.")
-
-            Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n- [ ] Existing task\n")
-
-            mock_output = """```markdown
+        Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n- [ ] Existing task\n")
+
+        mock_output = """```markdown
 ## Goal
 
 Test goal
@@ -278,51 +206,36 @@ Test goal
 
 - [ ] New task
 ```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["init", "--suggest"],
-                    input="y\n1\nn\n",
-                )
-
-            assert result.exit_code == 0
-            # Should indicate updating/merging
-            output_lower = result.output.lower()
-            assert (
-                "updat" in output_lower
-                or "merg" in output_lower
-                or "add" in output_lower
-            )
-
-    def test_init_manual_entry_merges_with_existing(self, tmp_path: Path) -> None:
+        mock_claude.return_value = (mock_output, None)
+        result = runner.invoke(
+            cli,
+            ["init", "--suggest"],
+            input="y\n1\nn\n",
+        )
+
+        assert result.exit_code == 0
+        # Should indicate updating/merging
+        output_lower = result.output.lower()
+        assert (
+            "updat" in output_lower or "merg" in output_lower or "add" in output_lower
+        )
+
+    def test_init_manual_entry_merges_with_existing(self, init_fs: Path) -> None:
         """Manual task entry also merges with existing TODO.md."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "LOOP-PROMPT.md").write_text(
-                "## Goal\n\n{{goal}}\n\n## Tasks\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "TODO.md").write_text(
-                "# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "META-PROMPT.md").write_text("Analyze {{goal}}")
-
-            Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n- [ ] Old task\n")
-
-            # No --suggest, so no Claude call, user enters manually
-            result = runner.invoke(
-                app,
-                ["init"],
-                input="README.md\nManual task 1\nManual task 2\n\n1\nn\n",
-            )
-
-            assert result.exit_code == 0
-
-            content = Path("TODO.md").read_text()
-            # Old task preserved
-            assert "- [ ] Old task" in content
-            # New manual tasks added
-            assert "- [ ] Manual task 1" in content
-            assert "- [ ] Manual task 2" in content
+        Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n- [ ] Old task\n")
+
+        # No --suggest, so no Claude call, user enters manually
+        result = runner.invoke(
+            cli,
+            ["init"],
+            input="README.md\nManual task 1\nManual task 2\n\n1\nn\n",
+        )
+
+        assert result.exit_code == 0
+
+        content = Path("TODO.md").read_text()
+        # Old task preserved
+        assert "- [ ] Old task" in content
+        # New manual tasks added
+        assert "- [ ] Manual task 1" in content
+        assert "- [ ] Manual task 2" in content
@@ -6,82 +6,72 @@ these suggestions.
 """
 
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock
 
-from typer.testing import CliRunner
+import pytest
 
-from wiggum.cli import app
+from tests.helpers import cli, runner
+from wiggum.config import read_config
 from wiggum.parsing import parse_markdown_from_output
 
-runner = CliRunner()
+
+# Planner reply with Goal, Tasks and Constraints; tests fill in each section
+PLANNER_OUTPUT = (
+    "```markdown\n## Goal\n\n{goal}\n\n## Tasks\n\n{tasks}\n\n"
+    "## Constraints\n\n{constraints}\n```"
+)
 
 
 class TestParseConstraintsFromMarkdown:
     """Tests for parsing constraints from Claude's markdown output."""
 
-    def test_parses_constraints_section(self) -> None:
-        """Should extract constraints from ## Constraints section."""
-        output = """```markdown
-## Goal
-
-Build a CLI tool
-
-## Tasks
-
-- [ ] Set up project structure
-
-## Constraints
-
-security_mode: yolo
-allow_paths: src/,tests/
-internet_access: true
-```"""
-        result = parse_markdown_from_output(output)
-        assert result is not None
-        assert "constraints" in result
-        assert result["constraints"]["security_mode"] == "yolo"
-        assert result["constraints"]["allow_paths"] == "src/,tests/"
-        assert result["constraints"]["internet_access"] is True
-
-    def test_parses_conservative_security_mode(self) -> None:
-        """Should parse conservative security mode."""
-        output = """```markdown
-## Goal
-
-Build a testing framework
-
-## Tasks
-
-- [ ] Create tests
-
-## Constraints
-
-security_mode: conservative
-```"""
-        result = parse_markdown_from_output(output)
-        assert result is not None
-        assert result["constraints"]["security_mode"] == "conservative"
-
-    def test_parses_path_restricted_security_mode(self) -> None:
-        """Should parse path-restricted security mode with paths."""
-        output = """```markdown
-## Goal
-
-Build an API
-
-## Tasks
-
-- [ ] Create endpoints
-
-## Constraints
-
-security_mode: path_restricted
-allow_paths: api/,models/,tests/
-```"""
+    @pytest.mark.parametrize(
+        "constraints,expected",
+        [
+            (
+                "security_mode: yolo\nallow_paths: src/,tests/\ninternet_access: true",
+                {
+                    "security_mode": "yolo",
+                    "allow_paths": "src/,tests/",
+                    "internet_access": True,
+                },
+            ),
+            ("security_mode: conservative", {"security_mode": "conservative"}),
+            (
+                "security_mode: path_restricted\nallow_paths: api/,models/,tests/",
+                {
+                    "security_mode": "path_restricted",
+                    "allow_paths": "api/,models/,tests/",
+                },
+            ),
+            (
+                "security_mode: conservative\ninternet_access: false",
+                {"security_mode": "conservative", "internet_access": False},
+            ),
+            ("internet_access: yes", {"internet_access": True}),
+            ("internet_access: no", {"internet_access": False}),
+        ],
+        ids=[
+            "all-fields",
+            "conservative",
+            "path-restricted",
+            "internet-false",
+            "internet-yes",
+            "internet-no",
+        ],
+    )
+    def test_parses_constraints_section(
+        self, constraints: str, expected: dict[str, object]
+    ) -> None:
+        """Should extract the ## Constraints section, including yes/no booleans."""
+        output = PLANNER_OUTPUT.format(
+            goal="Build a CLI tool",
+            tasks="- [ ] Set up project structure",
+            constraints=constraints,
+        )
         result = parse_markdown_from_output(output)
         assert result is not None
-        assert result["constraints"]["security_mode"] == "path_restricted"
-        assert result["constraints"]["allow_paths"] == "api/,models/,tests/"
+        assert result["constraints"] == expected
 
     def test_handles_missing_constraints_section(self) -> None:
         """Should return empty constraints when section is missing."""
@@ -95,257 +85,75 @@ allow_paths: api/,models/,tests/
         assert "constraints" in result
         assert result["constraints"] == {}
 
-    def test_parses_internet_access_false(self) -> None:
-        """Should parse internet_access: false."""
-        output = """```markdown
-## Goal
-
-Offline tool
-
-## Tasks
-
-- [ ] Build it
-
-## Constraints
-
-security_mode: conservative
-internet_access: false
-```"""
-        result = parse_markdown_from_output(output)
-        assert result is not None
-        assert result["constraints"]["internet_access"] is False
-
-    def test_handles_various_boolean_formats(self) -> None:
-        """Should handle different boolean formats for internet_access."""
-        # Test 'yes' as true
-        output = """```markdown
-## Goal
-
-Test
-
-## Tasks
-
-- [ ] Task
-
-## Constraints
-
-internet_access: yes
-```"""
-        result = parse_markdown_from_output(output)
-        assert result is not None
-        assert result["constraints"]["internet_access"] is True
-
-        # Test 'no' as false
-        output = """```markdown
-## Goal
-
-Test
-
-## Tasks
-
-- [ ] Task
-
-## Constraints
-
-internet_access: no
-```"""
-        result = parse_markdown_from_output(output)
-        assert result is not None
-        assert result["constraints"]["internet_access"] is False
-
 
 class TestInitUsesConstraintSuggestions:
     """Tests that init command uses constraint suggestions from Claude."""
 
-    def test_init_uses_suggested_yolo_mode(self, tmp_path: Path) -> None:
-        """Init should use yolo mode when Claude suggests it."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "LOOP-PROMPT.md").write_text(
-                "## Goal\n\n{{goal}}\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "TODO.md").write_text(
-                "# Tasks\n\n## Todo\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "META-PROMPT.md").write_text(
-                "{{goal}}{{existing_tasks}}"
-            )
-            # Add README.md so goal is inferred
-            Path("README.md").write_text("# Test Project\n\nA test project.")
-
-            # Mock Claude to return yolo constraint suggestion
-            claude_output = """```markdown
-## Goal
-
-Test project
-
-## Tasks
-
-- [ ] First task
-
-## Constraints
-
-security_mode: yolo
-```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(claude_output, None),
-            ):
-                # Accept suggestions (y), git (n) - yolo mode is auto-applied from constraints
-                result = runner.invoke(app, ["init", "--suggest"], input="y\nn\n")
-
-            config_file = Path(".wiggum.toml")
-            assert config_file.exists(), f"Config not created. Output: {result.output}"
-            content = config_file.read_text()
-            assert "yolo = true" in content
-
-    def test_init_uses_suggested_path_restricted_mode(self, tmp_path: Path) -> None:
-        """Init should use path-restricted mode when Claude suggests it."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "LOOP-PROMPT.md").write_text(
-                "## Goal\n\n{{goal}}\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "TODO.md").write_text(
-                "# Tasks\n\n## Todo\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "META-PROMPT.md").write_text(
-                "{{goal}}{{existing_tasks}}"
-            )
-            # Add README.md so goal is inferred
-            Path("README.md").write_text("# API Project\n\nA REST API.")
-
-            claude_output = """```markdown
-## Goal
-
-API project
-
-## Tasks
-
-- [ ] Build API
-
-## Constraints
-
-security_mode: path_restricted
-allow_paths: src/,tests/
-```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(claude_output, None),
-            ):
-                # Accept suggestions (y), git (n)
-                result = runner.invoke(app, ["init", "--suggest"], input="y\nn\n")
-
-            config_file = Path(".wiggum.toml")
-            assert config_file.exists(), f"Config not created. Output: {result.output}"
-            content = config_file.read_text()
-            assert "src/" in content
-            assert "tests/" in content
-
-    def test_init_uses_suggested_conservative_mode(self, tmp_path: Path) -> None:
-        """Init should use conservative mode when Claude suggests it."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "LOOP-PROMPT.md").write_text(
-                "## Goal\n\n{{goal}}\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "TODO.md").write_text(
-                "# Tasks\n\n## Todo\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "META-PROMPT.md").write_text(
-                "{{goal}}{{existing_tasks}}"
-            )
-            # Add README.md so goal is inferred
-            Path("README.md").write_text("# Sensitive Project\n\nHandles credentials.")
-
-            claude_output = """```markdown
-## Goal
-
-Sensitive project
-
-## Tasks
-
-- [ ] Handle credentials
-
-## Constraints
-
-security_mode: conservative
-```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(claude_output, None),
-            ):
-                # Accept suggestions (y), git (n)
-                result = runner.invoke(app, ["init", "--suggest"], input="y\nn\n")
-
-            config_file = Path(".wiggum.toml")
-            assert config_file.exists(), f"Config not created. Output: {result.output}"
-            content = config_file.read_text()
-            assert "yolo = false" in content
-            assert 'allow_paths = ""' in content
-
-    def test_init_shows_suggested_constraints(self, tmp_path: Path) -> None:
+    @pytest.mark.parametrize(
+        "constraints,expected",
+        [
+            ("security_mode: yolo", {"yolo": True, "allow_paths": ""}),
+            (
+                "security_mode: path_restricted\nallow_paths: src/,tests/",
+                {"yolo": False, "allow_paths": "src/,tests/"},
+            ),
+            ("security_mode: conservative", {"yolo": False, "allow_paths": ""}),
+        ],
+        ids=["yolo", "path-restricted", "conservative"],
+    )
+    def test_init_uses_suggested_security_mode(
+        self,
+        init_fs: Path,
+        mock_claude: Mock,
+        constraints: str,
+        expected: dict[str, object],
+    ) -> None:
+        """Init writes the security mode Claude suggests without prompting for it."""
+        # Add README.md so goal is inferred
+        Path("README.md").write_text("# Test Project\n\nA test project.")
+
+        mock_claude.return_value = (
+            PLANNER_OUTPUT.format(
+                goal="Test project", tasks="- [ ] First task", constraints=constraints
+            ),
+            None,
+        )
+        # Accept suggestions (y), git (n) - security is auto-applied from constraints
+        result = runner.invoke(cli, ["init", "--suggest"], input="y\nn\n")
+
+        assert Path(".wiggum.toml").exists(), (
+            f"Config not created. Output: {result.output}"
+        )
+        assert read_config()["security"] == expected
+
+    def test_init_shows_suggested_constraints(
+        self, init_fs: Path, mock_claude: Mock
+    ) -> None:
         """Init should display the suggested security constraints."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "LOOP-PROMPT.md").write_text(
-                "## Goal\n\n{{goal}}\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "TODO.md").write_text(
-                "# Tasks\n\n## Todo\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "META-PROMPT.md").write_text(
-                "{{goal}}{{existing_tasks}}"
-            )
-            # Add README.md so goal is inferred
-            Path("README.md").write_text("# Test Project\n\nA test.")
-
-            claude_output = """```markdown
-## Goal
-
-Test
-
-## Tasks
+        # Add README.md so goal is inferred
+        Path("README.md").write_text("# Test Project\n\nA test.")
 
-- [ ] Task
-
-## Constraints
-
-security_mode: yolo
-internet_access: true
-```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(claude_output, None),
-            ):
-                # Accept suggestions (y), git (n)
-                result = runner.invoke(app, ["init", "--suggest"], input="y\nn\n")
+        claude_output = PLANNER_OUTPUT.format(
+            goal="Test",
+            tasks="- [ ] Task",
+            constraints="security_mode: yolo\ninternet_access: true",
+        )
+        mock_claude.return_value = (claude_output, None)
+        # Accept suggestions (y), git (n)
+        result = runner.invoke(cli, ["init", "--suggest"], input="y\nn\n")
 
-            # Should show security mode in suggestions
-            assert (
-                "yolo" in result.output.lower() or "security" in result.output.lower()
-            )
+        # Should show security mode in suggestions
+        assert "yolo" in result.output.lower() or "security" in result.output.lower()
 
     def test_init_falls_back_to_manual_when_no_constraints(
-        self, tmp_path: Path
+        self, init_fs: Path, mock_claude: Mock
     ) -> None:
         """Init falls back to manual security selection if no constraints suggested."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "LOOP-PROMPT.md").write_text(
-                "## Goal\n\n{{goal}}\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "TODO.md").write_text(
-                "# Tasks\n\n## Todo\n\n{{tasks}}\n"
-            )
-            (Path("templates") / "META-PROMPT.md").write_text(
-                "{{goal}}{{existing_tasks}}"
-            )
-            # Add README.md so goal is inferred
-            Path("README.md").write_text("# Simple Project\n\nA simple project.")
+        # Add README.md so goal is inferred
+        Path("README.md").write_text("# Simple Project\n\nA simple project.")
 
-            # Claude output without constraints section
-            claude_output = """```markdown
+        # Claude output without constraints section
+        claude_output = """```markdown
 ## Goal
 
 Simple project
@@ -354,13 +162,10 @@ Simple project
 
 - [ ] Build it
 ```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(claude_output, None),
-            ):
-                # Accept suggestions for tasks (y), manually choose conservative (1), git (n)
-                result = runner.invoke(app, ["init", "--suggest"], input="y\n1\nn\n")
+        mock_claude.return_value = (claude_output, None)
+        # Accept suggestions for tasks (y), manually choose conservative (1), git (n)
+        result = runner.invoke(cli, ["init", "--suggest"], input="y\n1\nn\n")
 
-            # Should still have created config with manual selection
-            config_file = Path(".wiggum.toml")
-            assert config_file.exists()
+        # Should still have created config with manual selection
+        config_file = Path(".wiggum.toml")
+        assert config_file.exists()
@@ -3,11 +3,8 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from typer.testing import CliRunner
-
-from wiggum.cli import app, get_current_task
-
-runner = CliRunner()
+from tests.helpers import cli, runner
+from wiggum.cli import get_current_task
 
 
 class TestGetCurrentTask:
@@ -107,7 +104,7 @@ class TestRunDisplaysCurrentTask:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -139,7 +136,7 @@ class TestRunDisplaysCurrentTask:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
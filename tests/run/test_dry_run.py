@@ -0,0 +1,105 @@
+"""Tests for the run command's --dry-run summary."""
+
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+from wiggum.cli import _format_dry_run
+from wiggum.config import ResolvedRunConfig
+
+# Baseline resolved config; tests override individual fields
+BASE_CONFIG = ResolvedRunConfig(
+    yolo=False,
+    allow_paths=None,
+    max_iterations=10,
+    timeout=1800,
+    tasks_file=Path("TODO.md"),
+    prompt_file=None,
+    agent=None,
+    model=None,
+    log_file=None,
+    show_progress=False,
+    continue_session=False,
+    keep_running=False,
+    create_pr=False,
+    no_branch=False,
+    force=False,
+    branch_prefix="wiggum",
+    learning_enabled=False,
+    keep_diary=False,
+    auto_consolidate=True,
+)
+
+
+class TestFormatDryRun:
+    """Tests for _format_dry_run, called without going through the CLI."""
+
+    def test_shows_core_settings(self) -> None:
+        """Summary always lists iterations, agent, timeout, command and prompt."""
+        output = _format_dry_run(BASE_CONFIG, "claude", "test prompt")
+
+        assert "Would run 10 iterations" in output
+        assert "Agent: claude" in output
+        assert "Timeout: 1800s per iteration" in output
+        assert "Command: claude --print -p <prompt>" in output
+        assert "Stop condition: tasks (check TODO.md)" in output
+        assert "Branch prefix: wiggum" in output
+        assert output.endswith("Prompt:\n---\ntest prompt\n---")
+
+    def test_default_modes(self) -> None:
+        """Defaults are stop-when-done, reset sessions and git safety enabled."""
+        output = _format_dry_run(BASE_CONFIG, "claude", "test prompt")
+
+        assert "Task completion mode: stop when done" in output
+        assert "Session mode: reset" in output
+        assert "Git safety: enabled" in output
+
+    def test_omits_unset_optional_lines(self) -> None:
+        """Model, log file, progress and PR lines only appear when enabled."""
+        output = _format_dry_run(BASE_CONFIG, "claude", "test prompt")
+
+        assert "Model:" not in output
+        assert "Log file:" not in output
+        assert "Progress tracking:" not in output
+        assert "PR creation:" not in output
+
+    @pytest.mark.parametrize(
+        "overrides,expected",
+        [
+            ({"model": "opus"}, "Model: opus"),
+            ({"log_file": Path("loop.log")}, "Log file: loop.log"),
+            ({"show_progress": True}, "Progress tracking: enabled"),
+            ({"keep_running": True}, "Task completion mode: keep running"),
+            ({"continue_session": True}, "Session mode: continue"),
+            ({"no_branch": True}, "Git safety: disabled (--no-branch)"),
+            ({"force": True}, "Git safety: disabled (--force)"),
+            ({"create_pr": True}, "PR creation: enabled"),
+        ],
+        ids=[
+            "model",
+            "log-file",
+            "progress",
+            "keep-running",
+            "continue-session",
+            "no-branch",
+            "force",
+            "pr",
+        ],
+    )
+    def test_shows_enabled_option(self, overrides: dict, expected: str) -> None:
+        """Each enabled option adds its line to the summary."""
+        cfg = dataclasses.replace(BASE_CONFIG, **overrides)
+
+        output = _format_dry_run(cfg, "claude", "test prompt")
+
+        assert expected in output
+
+    def test_uses_agent_specific_command(self) -> None:
+        """The command line reflects the selected agent and its flags."""
+        cfg = dataclasses.replace(BASE_CONFIG, yolo=True)
+
+        output = _format_dry_run(cfg, "gemini", "test prompt")
+
+        assert "Agent: gemini" in output
+        assert "Command: gemini -p <prompt> --yolo" in output
@@ -3,31 +3,31 @@
 from pathlib import Path
 from unittest.mock import patch
 
-from typer.testing import CliRunner
+import pytest
 
-from wiggum.cli import app
-
-runner = CliRunner()
+from tests.helpers import cli, runner
 
 
 class TestIdentifyTasks:
     """Tests for the `wiggum run --identify-tasks` option."""
 
-    def test_identify_tasks_populates_tasks_file(self, tmp_path: Path) -> None:
+    def test_identify_tasks_populates_tasks_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """--identify-tasks analyzes codebase and populates TODO.md."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Create minimal required files
-            Path("templates").mkdir()
-            (Path("templates") / "META-PROMPT.md").write_text(
-                "Analyze {{goal}}\n{{existing_tasks}}"
-            )
-            Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
-            Path("TODO.md").write_text(
-                "# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n"
-            )
-
-            # Mock Claude to return task suggestions
-            mock_output = """```markdown
+        monkeypatch.chdir(tmp_path)
+        # Create minimal required files
+        Path("templates").mkdir()
+        (Path("templates") / "META-PROMPT.md").write_text(
+            "Analyze {{goal}}\n{{existing_tasks}}"
+        )
+        Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
+        Path("TODO.md").write_text(
+            "# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n"
+        )
+
+        # Mock Claude to return task suggestions
+        mock_output = """```markdown
 ## Goal
 
 Test goal
@@ -38,29 +38,31 @@ Test goal
 - [ ] Add missing test coverage
 - [ ] Clean up unused imports
 ```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(app, ["run", "--identify-tasks"])
-
-            assert result.exit_code == 0
-            content = Path("TODO.md").read_text()
-            assert "- [ ] Refactor utility functions for clarity" in content
-            assert "- [ ] Add missing test coverage" in content
-            assert "- [ ] Clean up unused imports" in content
-
-    def test_identify_tasks_does_not_run_loop(self, tmp_path: Path) -> None:
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(cli, ["run", "--identify-tasks"])
+
+        assert result.exit_code == 0
+        content = Path("TODO.md").read_text()
+        assert "- [ ] Refactor utility functions for clarity" in content
+        assert "- [ ] Add missing test coverage" in content
+        assert "- [ ] Clean up unused imports" in content
+
+    def test_identify_tasks_does_not_run_loop(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """--identify-tasks exits after identifying tasks, doesn't run loop."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "META-PROMPT.md").write_text(
-                "Analyze {{goal}}\n{{existing_tasks}}"
-            )
-            Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
-            Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n")
-
-            mock_output = """```markdown
+        monkeypatch.chdir(tmp_path)
+        Path("templates").mkdir()
+        (Path("templates") / "META-PROMPT.md").write_text(
+            "Analyze {{goal}}\n{{existing_tasks}}"
+        )
+        Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
+        Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n")
+
+        mock_output = """```markdown
 ## Goal
 
 Test goal
@@ -69,39 +71,41 @@ Test goal
 
 - [ ] Some task
 ```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ) as mock_planning:
-                # Also patch subprocess.run to track if loop would run
-                with patch("subprocess.run") as mock_run:
-                    result = runner.invoke(app, ["run", "--identify-tasks"])
-
-            assert result.exit_code == 0
-            # Planning should have been called
-            assert mock_planning.called
-            # Loop should NOT have run (no subprocess.run calls for claude)
-            # The run_claude_for_planning is mocked, so subprocess.run should not be called
-            assert not mock_run.called
-
-    def test_identify_tasks_merges_with_existing(self, tmp_path: Path) -> None:
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ) as mock_planning:
+            # Also patch subprocess.run to track if loop would run
+            with patch("subprocess.run") as mock_run:
+                result = runner.invoke(cli, ["run", "--identify-tasks"])
+
+        assert result.exit_code == 0
+        # Planning should have been called
+        assert mock_planning.called
+        # Loop should NOT have run (no subprocess.run calls for claude)
+        # The run_claude_for_planning is mocked, so subprocess.run should not be called
+        assert not mock_run.called
+
+    def test_identify_tasks_merges_with_existing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """--identify-tasks merges new tasks with existing ones, no duplicates."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "META-PROMPT.md").write_text(
-                "Analyze {{goal}}\n{{existing_tasks}}"
-            )
-            Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
-            Path("TODO.md").write_text(
-                "# Tasks\n\n"
-                "## Done\n\n"
-                "- [x] Completed task\n\n"
-                "## In Progress\n\n"
-                "## Todo\n\n"
-                "- [ ] Existing task\n"
-            )
-
-            mock_output = """```markdown
+        monkeypatch.chdir(tmp_path)
+        Path("templates").mkdir()
+        (Path("templates") / "META-PROMPT.md").write_text(
+            "Analyze {{goal}}\n{{existing_tasks}}"
+        )
+        Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
+        Path("TODO.md").write_text(
+            "# Tasks\n\n"
+            "## Done\n\n"
+            "- [x] Completed task\n\n"
+            "## In Progress\n\n"
+            "## Todo\n\n"
+            "- [ ] Existing task\n"
+        )
+
+        mock_output = """```markdown
 ## Goal
 
 Test goal
@@ -111,32 +115,34 @@ Test goal
 - [ ] Existing task
 - [ ] New refactoring task
 ```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(app, ["run", "--identify-tasks"])
-
-            assert result.exit_code == 0
-            content = Path("TODO.md").read_text()
-            # Existing task should not be duplicated
-            assert content.count("Existing task") == 1
-            # New task should be added
-            assert "- [ ] New refactoring task" in content
-            # Completed task preserved
-            assert "- [x] Completed task" in content
-
-    def test_identify_tasks_displays_identified_tasks(self, tmp_path: Path) -> None:
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(cli, ["run", "--identify-tasks"])
+
+        assert result.exit_code == 0
+        content = Path("TODO.md").read_text()
+        # Existing task should not be duplicated
+        assert content.count("Existing task") == 1
+        # New task should be added
+        assert "- [ ] New refactoring task" in content
+        # Completed task preserved
+        assert "- [x] Completed task" in content
+
+    def test_identify_tasks_displays_identified_tasks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """--identify-tasks displays the identified tasks to user."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "META-PROMPT.md").write_text(
-                "Analyze {{goal}}\n{{existing_tasks}}"
-            )
-            Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
-            Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n")
-
-            mock_output = """```markdown
+        monkeypatch.chdir(tmp_path)
+        Path("templates").mkdir()
+        (Path("templates") / "META-PROMPT.md").write_text(
+            "Analyze {{goal}}\n{{existing_tasks}}"
+        )
+        Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
+        Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n")
+
+        mock_output = """```markdown
 ## Goal
 
 Test goal
@@ -146,49 +152,49 @@ Test goal
 - [ ] Simplify complex function
 - [ ] Add error handling
 ```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(app, ["run", "--identify-tasks"])
-
-            assert result.exit_code == 0
-            # Should display identified tasks
-            assert "Simplify complex function" in result.output
-            assert "Add error handling" in result.output
-
-    def test_identify_tasks_handles_empty_response(self, tmp_path: Path) -> None:
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(cli, ["run", "--identify-tasks"])
+
+        assert result.exit_code == 0
+        # Should display identified tasks
+        assert "Simplify complex function" in result.output
+        assert "Add error handling" in result.output
+
+    def test_identify_tasks_handles_empty_response(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """--identify-tasks handles case when Claude returns no output."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "META-PROMPT.md").write_text(
-                "Analyze {{goal}}\n{{existing_tasks}}"
-            )
-            Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
-            Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n- [ ] Existing\n")
-
-            with patch(
-                "wiggum.runner.run_claude_for_planning", return_value=(None, None)
-            ):
-                result = runner.invoke(app, ["run", "--identify-tasks"])
-
-            assert result.exit_code == 0
-            # Should indicate no output from Claude
-            assert "no output" in result.output.lower()
-            # Existing tasks preserved
-            content = Path("TODO.md").read_text()
-            assert "- [ ] Existing" in content
+        monkeypatch.chdir(tmp_path)
+        Path("templates").mkdir()
+        (Path("templates") / "META-PROMPT.md").write_text(
+            "Analyze {{goal}}\n{{existing_tasks}}"
+        )
+        Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
+        Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n- [ ] Existing\n")
+
+        with patch("wiggum.runner.run_claude_for_planning", return_value=(None, None)):
+            result = runner.invoke(cli, ["run", "--identify-tasks"])
+
+        assert result.exit_code == 0
+        # Should indicate no output from Claude
+        assert "no output" in result.output.lower()
+        # Existing tasks preserved
+        content = Path("TODO.md").read_text()
+        assert "- [ ] Existing" in content
 
     def test_identify_tasks_uses_bundled_template_when_no_local(
-        self, tmp_path: Path
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """--identify-tasks uses bundled META-PROMPT.md when no local templates exist."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
-            Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n")
+        monkeypatch.chdir(tmp_path)
+        Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
+        Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n")
 
-            # No local templates/ directory - should fall back to bundled templates
-            mock_output = """```markdown
+        # No local templates/ directory - should fall back to bundled templates
+        mock_output = """```markdown
 ## Goal
 
 Test goal
@@ -197,27 +203,29 @@ Test goal
 
 - [ ] Task using bundled template
 ```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(app, ["run", "--identify-tasks"])
-
-            assert result.exit_code == 0
-            content = Path("TODO.md").read_text()
-            assert "- [ ] Task using bundled template" in content
-
-    def test_identify_tasks_creates_tasks_file_if_missing(self, tmp_path: Path) -> None:
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(cli, ["run", "--identify-tasks"])
+
+        assert result.exit_code == 0
+        content = Path("TODO.md").read_text()
+        assert "- [ ] Task using bundled template" in content
+
+    def test_identify_tasks_creates_tasks_file_if_missing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """--identify-tasks creates TODO.md if it doesn't exist."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "META-PROMPT.md").write_text(
-                "Analyze {{goal}}\n{{existing_tasks}}"
-            )
-            Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
-            # Note: No TODO.md file
-
-            mock_output = """```markdown
+        monkeypatch.chdir(tmp_path)
+        Path("templates").mkdir()
+        (Path("templates") / "META-PROMPT.md").write_text(
+            "Analyze {{goal}}\n{{existing_tasks}}"
+        )
+        Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
+        # Note: No TODO.md file
+
+        mock_output = """```markdown
 ## Goal
 
 Test goal
@@ -226,31 +234,31 @@ Test goal
 
 - [ ] First identified task
 ```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(app, ["run", "--identify-tasks"])
-
-            assert result.exit_code == 0
-            assert Path("TODO.md").exists()
-            content = Path("TODO.md").read_text()
-            assert "- [ ] First identified task" in content
-
-    def test_identify_tasks_uses_readme_for_context(self, tmp_path: Path) -> None:
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(cli, ["run", "--identify-tasks"])
+
+        assert result.exit_code == 0
+        assert Path("TODO.md").exists()
+        content = Path("TODO.md").read_text()
+        assert "- [ ] First identified task" in content
+
+    def test_identify_tasks_uses_readme_for_context(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """--identify-tasks uses README.md content for goal inference."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "META-PROMPT.md").write_text(
-                "Analyze {{goal}}\n{{existing_tasks}}"
-            )
-            Path("LOOP-PROMPT.md").write_text("## Goal\n\nBuild a CLI tool")
-            Path("README.md").write_text(
-                "# My CLI Tool\n\nA tool for automating tasks."
-            )
-            Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n")
-
-            mock_output = """```markdown
+        monkeypatch.chdir(tmp_path)
+        Path("templates").mkdir()
+        (Path("templates") / "META-PROMPT.md").write_text(
+            "Analyze {{goal}}\n{{existing_tasks}}"
+        )
+        Path("LOOP-PROMPT.md").write_text("## Goal\n\nBuild a CLI tool")
+        Path("README.md").write_text("# My CLI Tool\n\nA tool for automating tasks.")
+        Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n")
+
+        mock_output = """```markdown
 ## Goal
 
 Build CLI automation tool
@@ -259,28 +267,30 @@ Build CLI automation tool
 
 - [ ] Improve CLI help messages
 ```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ) as mock_planning:
-                result = runner.invoke(app, ["run", "--identify-tasks"])
-
-            assert result.exit_code == 0
-            # Check that README content was passed to planning
-            call_args = mock_planning.call_args[0][0]
-            assert "My CLI Tool" in call_args or "automating" in call_args
-
-    def test_identify_tasks_shows_count_of_added_tasks(self, tmp_path: Path) -> None:
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ) as mock_planning:
+            result = runner.invoke(cli, ["run", "--identify-tasks"])
+
+        assert result.exit_code == 0
+        # Check that README content was passed to planning
+        call_args = mock_planning.call_args[0][0]
+        assert "My CLI Tool" in call_args or "automating" in call_args
+
+    def test_identify_tasks_shows_count_of_added_tasks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """--identify-tasks shows how many tasks were added."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("templates").mkdir()
-            (Path("templates") / "META-PROMPT.md").write_text(
-                "Analyze {{goal}}\n{{existing_tasks}}"
-            )
-            Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
-            Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n")
-
-            mock_output = """```markdown
+        monkeypatch.chdir(tmp_path)
+        Path("templates").mkdir()
+        (Path("templates") / "META-PROMPT.md").write_text(
+            "Analyze {{goal}}\n{{existing_tasks}}"
+        )
+        Path("LOOP-PROMPT.md").write_text("## Goal\n\nTest goal")
+        Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n")
+
+        mock_output = """```markdown
 ## Goal
 
 Test goal
@@ -291,12 +301,12 @@ Test goal
 - [ ] Task two
 - [ ] Task three
 ```"""
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(app, ["run", "--identify-tasks"])
-
-            assert result.exit_code == 0
-            # Should show count
-            assert "3" in result.output or "three" in result.output.lower()
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(cli, ["run", "--identify-tasks"])
+
+        assert result.exit_code == 0
+        # Should show count
+        assert "3" in result.output or "three" in result.output.lower()
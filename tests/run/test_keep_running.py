@@ -7,11 +7,9 @@ and add them to TODO.md. This is controlled by --keep-running flag.
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from typer.testing import CliRunner
+import pytest
 
-from wiggum.cli import app
-
-runner = CliRunner()
+from tests.helpers import cli, runner
 
 
 class TestKeepRunningFlag:
@@ -31,7 +29,7 @@ class TestKeepRunningFlag:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -70,7 +68,7 @@ class TestKeepRunningFlag:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -120,7 +118,7 @@ class TestKeepRunningFlag:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -153,7 +151,7 @@ class TestKeepRunningFlag:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -181,7 +179,7 @@ class TestKeepRunningFlag:
         prompt_file.write_text("test prompt")
 
         result = runner.invoke(
-            app,
+            cli,
             [
                 "run",
                 "-f",
@@ -205,7 +203,7 @@ class TestKeepRunningDryRun:
         prompt_file.write_text("test prompt")
 
         result = runner.invoke(
-            app,
+            cli,
             [
                 "run",
                 "-f",
@@ -223,7 +221,7 @@ class TestKeepRunningDryRun:
         prompt_file.write_text("test prompt")
 
         result = runner.invoke(
-            app,
+            cli,
             [
                 "run",
                 "-f",
@@ -240,7 +238,9 @@ class TestKeepRunningDryRun:
 class TestKeepRunningConfig:
     """Tests for keep_running in .wiggum.toml configuration."""
 
-    def test_config_keep_running_true_continues_loop(self, tmp_path: Path) -> None:
+    def test_config_keep_running_true_continues_loop(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Config with keep_running = true continues loop when tasks complete."""
         from wiggum.agents import AgentResult
 
@@ -256,17 +256,11 @@ class TestKeepRunningConfig:
         mock_agent.run.return_value = AgentResult(stdout="", stderr="", return_code=0)
 
         # Change to tmp_path so config file is found
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            with patch("wiggum.agents.check_cli_available", return_value=True):
-
-                with patch("wiggum.cli.get_agent", return_value=mock_agent):
-
-                    result = runner.invoke(
-                    app,
+        monkeypatch.chdir(tmp_path)
+        with patch("wiggum.agents.check_cli_available", return_value=True):
+            with patch("wiggum.cli.get_agent", return_value=mock_agent):
+                result = runner.invoke(
+                    cli,
                     [
                         "run",
                         "-f",
@@ -279,14 +273,14 @@ class TestKeepRunningConfig:
                         "--no-branch",
                     ],
                 )
-        finally:
-            os.chdir(original_cwd)
 
         # Should run both iterations
         assert mock_agent.run.call_count == 2
         assert result.exit_code == 0
 
-    def test_cli_flag_overrides_config(self, tmp_path: Path) -> None:
+    def test_cli_flag_overrides_config(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """CLI flag --stop-when-done overrides config keep_running = true."""
         prompt_file = tmp_path / "LOOP-PROMPT.md"
         prompt_file.write_text("test prompt")
@@ -295,17 +289,11 @@ class TestKeepRunningConfig:
         config_file = tmp_path / ".wiggum.toml"
         config_file.write_text("[loop]\nkeep_running = true\n")
 
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            with patch("wiggum.agents.check_cli_available", return_value=True):
-
-                with patch("wiggum.cli.get_agent") as mock_get_agent:
-
-                    result = runner.invoke(
-                    app,
+        monkeypatch.chdir(tmp_path)
+        with patch("wiggum.agents.check_cli_available", return_value=True):
+            with patch("wiggum.cli.get_agent") as mock_get_agent:
+                result = runner.invoke(
+                    cli,
                     [
                         "run",
                         "-f",
@@ -319,8 +307,6 @@ class TestKeepRunningConfig:
                         "--no-branch",
                     ],
                 )
-        finally:
-            os.chdir(original_cwd)
 
         # Should not run because --stop-when-done overrides config
         mock_get_agent.return_value.run.assert_not_called()
@@ -331,25 +317,21 @@ class TestKeepRunningConfig:
 class TestConfigFileWritesKeepRunning:
     """Tests that write_config correctly handles keep_running."""
 
-    def test_write_config_includes_keep_running(self, tmp_path: Path) -> None:
+    def test_write_config_includes_keep_running(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """write_config correctly writes keep_running to [loop] section."""
         from wiggum.config import write_config, read_config
 
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            config = {
-                "loop": {
-                    "max_iterations": 10,
-                    "keep_running": True,
-                }
+        monkeypatch.chdir(tmp_path)
+        config = {
+            "loop": {
+                "max_iterations": 10,
+                "keep_running": True,
             }
-            write_config(config)
+        }
+        write_config(config)
 
-            # Read back and verify
-            result = read_config()
-            assert result.get("loop", {}).get("keep_running") is True
-        finally:
-            os.chdir(original_cwd)
+        # Read back and verify
+        result = read_config()
+        assert result.get("loop", {}).get("keep_running") is True
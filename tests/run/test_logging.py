@@ -4,11 +4,7 @@ import re
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from typer.testing import CliRunner
-
-from wiggum.cli import app
-
-runner = CliRunner()
+from tests.helpers import cli, runner
 
 
 class TestLogFileOption:
@@ -41,7 +37,7 @@ class TestLogFileOption:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -85,7 +81,7 @@ class TestLogFileOption:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -131,7 +127,7 @@ class TestLogFileContent:
 
 
                 runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -176,7 +172,7 @@ class TestLogFileContent:
 
 
                 runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -224,7 +220,7 @@ class TestLogFileContent:
 
 
                 runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -291,7 +287,7 @@ class TestLogFileMultipleIterations:
 
 
                 runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -345,7 +341,7 @@ class TestLogFileMultipleIterations:
 
 
                 runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -377,7 +373,7 @@ class TestDryRunWithLogFile:
         log_file = tmp_path / "loop.log"
 
         result = runner.invoke(
-            app,
+            cli,
             [
                 "run",
                 "-f",
@@ -3,11 +3,9 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from typer.testing import CliRunner
+import pytest
 
-from wiggum.cli import app
-
-runner = CliRunner()
+from tests.helpers import cli, runner
 
 
 class TestVerboseFlag:
@@ -37,7 +35,7 @@ class TestVerboseFlag:
                 "wiggum.agents_claude.subprocess.run", side_effect=mock_subprocess_run
             ):
                 result = runner.invoke(
-                    app,
+                    cli,
                     [
                         "run",
                         "-f",
@@ -79,7 +77,7 @@ class TestVerboseFlag:
                 "wiggum.agents_claude.subprocess.run", side_effect=mock_subprocess_run
             ):
                 result = runner.invoke(
-                    app,
+                    cli,
                     [
                         "run",
                         "-f",
@@ -103,7 +101,7 @@ class TestVerboseFlag:
         prompt_file.write_text("test prompt")
 
         result = runner.invoke(
-            app,
+            cli,
             [
                 "run",
                 "-f",
@@ -148,7 +146,7 @@ class TestShowProgressFlag:
                 "wiggum.agents_claude.subprocess.run", side_effect=mock_subprocess_run
             ):
                 result = runner.invoke(
-                    app,
+                    cli,
                     [
                         "run",
                         "-f",
@@ -187,7 +185,7 @@ class TestShowProgressFlag:
         with patch("wiggum.agents.check_cli_available", return_value=True):
             with patch("wiggum.cli.get_agent", return_value=mock_agent):
                 result = runner.invoke(
-                    app,
+                    cli,
                     [
                         "run",
                         "-f",
@@ -230,7 +228,7 @@ class TestProgressOutput:
                 "wiggum.agents_claude.subprocess.run", side_effect=mock_subprocess_run
             ):
                 result = runner.invoke(
-                    app,
+                    cli,
                     [
                         "run",
                         "-f",
@@ -270,7 +268,7 @@ class TestProgressOutput:
                 "wiggum.agents_claude.subprocess.run", side_effect=mock_subprocess_run
             ):
                 result = runner.invoke(
-                    app,
+                    cli,
                     [
                         "run",
                         "-f",
@@ -308,7 +306,7 @@ class TestProgressOutput:
                 "wiggum.agents_claude.subprocess.run", side_effect=mock_subprocess_run
             ):
                 result = runner.invoke(
-                    app,
+                    cli,
                     [
                         "run",
                         "-f",
@@ -346,7 +344,7 @@ class TestProgressOutput:
                 "wiggum.agents_claude.subprocess.run", side_effect=mock_subprocess_run
             ):
                 result = runner.invoke(
-                    app,
+                    cli,
                     [
                         "run",
                         "-f",
@@ -369,43 +367,45 @@ class TestProgressOutput:
 class TestNonGitDirectory:
     """Tests for handling non-git directories gracefully."""
 
-    def test_non_git_directory_shows_warning(self, tmp_path: Path) -> None:
+    def test_non_git_directory_shows_warning(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """When not in a git repository, a warning is shown but loop continues."""
         from wiggum.agents import AgentResult
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            prompt_file = Path("LOOP-PROMPT.md")
-            prompt_file.write_text("test prompt")
-            tasks_file = Path("TODO.md")
-            tasks_file.write_text("# Tasks\n\n## Todo\n\n- [ ] task1\n")
+        monkeypatch.chdir(tmp_path)
+        prompt_file = Path("LOOP-PROMPT.md")
+        prompt_file.write_text("test prompt")
+        tasks_file = Path("TODO.md")
+        tasks_file.write_text("# Tasks\n\n## Todo\n\n- [ ] task1\n")
 
-            def mock_agent_run(config):
-                tasks_file.write_text("# Tasks\n\n## Done\n\n- [x] task1\n")
-                return AgentResult(stdout="Claude output", stderr="", return_code=0)
-
-            mock_agent = MagicMock()
-            mock_agent.name = "claude"
-            mock_agent.run.side_effect = mock_agent_run
-
-            with patch("wiggum.agents.check_cli_available", return_value=True):
-                with patch("wiggum.cli.get_agent", return_value=mock_agent):
-                    with patch("wiggum.git.is_git_repo", return_value=False):
-                        result = runner.invoke(
-                            app,
-                            [
-                                "run",
-                                "--show-progress",
-                                "-n",
-                                "5",
-                                "--force",
-                                "--no-branch",
-                            ],
-                        )
-
-            # Loop should complete successfully even without git
-            assert result.exit_code == 0
-            # With --force, no warning is shown but loop still runs
-            # Progress tracking still works (shows iteration info)
+        def mock_agent_run(config):
+            tasks_file.write_text("# Tasks\n\n## Done\n\n- [x] task1\n")
+            return AgentResult(stdout="Claude output", stderr="", return_code=0)
+
+        mock_agent = MagicMock()
+        mock_agent.name = "claude"
+        mock_agent.run.side_effect = mock_agent_run
+
+        with patch("wiggum.agents.check_cli_available", return_value=True):
+            with patch("wiggum.cli.get_agent", return_value=mock_agent):
+                with patch("wiggum.git.is_git_repo", return_value=False):
+                    result = runner.invoke(
+                        cli,
+                        [
+                            "run",
+                            "--show-progress",
+                            "-n",
+                            "5",
+                            "--force",
+                            "--no-branch",
+                        ],
+                    )
+
+        # Loop should complete successfully even without git
+        assert result.exit_code == 0
+        # With --force, no warning is shown but loop still runs
+        # Progress tracking still works (shows iteration info)
 
 
 class TestProgressMultipleIterations:
@@ -442,7 +442,7 @@ class TestProgressMultipleIterations:
         with patch("wiggum.agents.check_cli_available", return_value=True):
             with patch("wiggum.cli.get_agent", return_value=mock_agent):
                 result = runner.invoke(
-                    app,
+                    cli,
                     [
                         "run",
                         "-f",
@@ -471,7 +471,7 @@ class TestDryRunWithProgress:
         prompt_file.write_text("test prompt")
 
         result = runner.invoke(
-            app,
+            cli,
             [
                 "run",
                 "-f",
@@ -509,7 +509,7 @@ class TestTimestampedDebugOutput:
         with patch("wiggum.agents.check_cli_available", return_value=True):
             with patch("wiggum.cli.get_agent", return_value=mock_agent):
                 result = runner.invoke(
-                    app,
+                    cli,
                     [
                         "run",
                         "-f",
@@ -555,7 +555,7 @@ class TestTimestampedDebugOutput:
         with patch("wiggum.agents.check_cli_available", return_value=True):
             with patch("wiggum.cli.get_agent", return_value=mock_agent):
                 result = runner.invoke(
-                    app,
+                    cli,
                     [
                         "run",
                         "-f",
@@ -596,7 +596,7 @@ class TestTimestampedDebugOutput:
         with patch("wiggum.agents.check_cli_available", return_value=True):
             with patch("wiggum.cli.get_agent", return_value=mock_agent):
                 result = runner.invoke(
-                    app,
+                    cli,
                     [
                         "run",
                         "-f",
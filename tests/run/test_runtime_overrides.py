@@ -3,11 +3,7 @@
 from pathlib import Path
 from unittest.mock import patch
 
-from typer.testing import CliRunner
-
-from wiggum.cli import app
-
-runner = CliRunner()
+from tests.helpers import cli, runner
 
 
 class TestDefaultStopCondition:
@@ -28,7 +24,7 @@ class TestDefaultStopCondition:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -62,7 +58,7 @@ class TestDefaultStopCondition:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
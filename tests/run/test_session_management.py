@@ -1,13 +1,36 @@
 """Tests for session management (--continue vs --reset) in wiggum."""
 
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
-from typer.testing import CliRunner
+import pytest
 
-from wiggum.cli import app
+from tests.helpers import COMPLETED, cli, runner
 
-runner = CliRunner()
+
+@pytest.fixture
+def claude_subprocess(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Stub out the claude CLI: skip the availability check, mock subprocess.run."""
+    mock_run = Mock(return_value=COMPLETED)
+    monkeypatch.setattr("wiggum.agents.check_cli_available", lambda name: True)
+    monkeypatch.setattr("wiggum.agents_claude.subprocess.run", mock_run)
+    return mock_run
+
+
+def _write_tasks_per_call(tasks_file: Path, *contents: str) -> Callable[..., object]:
+    """Build a subprocess.run side effect that advances TODO.md on each call.
+
+    The Nth call writes the Nth entry of contents to tasks_file and returns
+    COMPLETED, simulating the agent ticking off tasks.
+    """
+    pending = iter(contents)
+
+    def run(cmd, **kwargs):
+        tasks_file.write_text(next(pending))
+        return COMPLETED
+
+    return run
 
 
 class TestContinueFlag:
@@ -51,7 +74,7 @@ class TestContinueFlag:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -76,7 +99,7 @@ class TestContinueFlag:
         assert configs_received[1].continue_session is True
 
     def test_continue_flag_first_iteration_has_no_continue(
-        self, tmp_path: Path
+        self, tmp_path: Path, claude_subprocess: Mock
     ) -> None:
         """The first iteration never has -c flag even with --continue."""
         prompt_file = tmp_path / "LOOP-PROMPT.md"
@@ -84,166 +107,133 @@ class TestContinueFlag:
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n- [ ] task1\n")
 
-        def mock_subprocess_run(cmd, **kwargs):
-            # Complete the task immediately
-            tasks_file.write_text("# Tasks\n\n## Done\n\n- [x] task1\n")
-            return MagicMock(returncode=0)
-
-        with patch("wiggum.agents.check_cli_available", return_value=True):
-
-
-            with patch(
-            "wiggum.agents_claude.subprocess.run", side_effect=mock_subprocess_run
-        ) as mock_run:
-
+        # Complete the task immediately
+        claude_subprocess.side_effect = _write_tasks_per_call(
+            tasks_file, "# Tasks\n\n## Done\n\n- [x] task1\n"
+        )
 
-                result = runner.invoke(
-                app,
-                [
-                    "run",
-                    "-f",
-                    str(prompt_file),
-                    "--tasks",
-                    str(tasks_file),
-                    "-n",
-                    "5",
-                    "--continue",
-                    "--force",
-                    "--no-branch",
-                ],
-            )
+        result = runner.invoke(
+            cli,
+            [
+                "run",
+                "-f",
+                str(prompt_file),
+                "--tasks",
+                str(tasks_file),
+                "-n",
+                "5",
+                "--continue",
+                "--force",
+                "--no-branch",
+            ],
+        )
 
         assert result.exit_code == 0
         # First call should NOT have -c flag
-        first_call_args = mock_run.call_args_list[0][0][0]
+        first_call_args = claude_subprocess.call_args_list[0].args[0]
         assert "-c" not in first_call_args
 
 
 class TestResetFlag:
     """Tests for the --reset flag (or default behavior) to start fresh each iteration."""
 
-    def test_default_behavior_no_continue_flag_to_claude(self, tmp_path: Path) -> None:
+    def test_default_behavior_no_continue_flag_to_claude(
+        self, tmp_path: Path, claude_subprocess: Mock
+    ) -> None:
         """By default (without --continue), claude is never called with -c flag."""
         prompt_file = tmp_path / "LOOP-PROMPT.md"
         prompt_file.write_text("test prompt")
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n- [ ] task1\n- [ ] task2\n")
 
-        call_count = 0
-
-        def mock_subprocess_run(cmd, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                tasks_file.write_text(
-                    "# Tasks\n\n## Todo\n\n- [ ] task2\n\n## Done\n\n- [x] task1\n"
-                )
-            elif call_count == 2:
-                tasks_file.write_text(
-                    "# Tasks\n\n## Done\n\n- [x] task1\n- [x] task2\n"
-                )
-            return MagicMock(returncode=0)
-
-        with patch("wiggum.agents.check_cli_available", return_value=True):
-
-
-            with patch(
-            "wiggum.agents_claude.subprocess.run", side_effect=mock_subprocess_run
-        ) as mock_run:
-
+        claude_subprocess.side_effect = _write_tasks_per_call(
+            tasks_file,
+            "# Tasks\n\n## Todo\n\n- [ ] task2\n\n## Done\n\n- [x] task1\n",
+            "# Tasks\n\n## Done\n\n- [x] task1\n- [x] task2\n",
+        )
 
-                result = runner.invoke(
-                app,
-                [
-                    "run",
-                    "-f",
-                    str(prompt_file),
-                    "--tasks",
-                    str(tasks_file),
-                    "-n",
-                    "5",
-                    "--force",
-                    "--no-branch",
-                ],
-            )
+        result = runner.invoke(
+            cli,
+            [
+                "run",
+                "-f",
+                str(prompt_file),
+                "--tasks",
+                str(tasks_file),
+                "-n",
+                "5",
+                "--force",
+                "--no-branch",
+            ],
+        )
 
         assert result.exit_code == 0
-        assert call_count == 2
+        assert claude_subprocess.call_count == 2
 
         # Neither call should have -c flag
-        for call_args in mock_run.call_args_list:
-            args = call_args[0][0]
+        for call_args in claude_subprocess.call_args_list:
+            args = call_args.args[0]
             assert "-c" not in args
 
-    def test_reset_flag_same_as_default(self, tmp_path: Path) -> None:
+    def test_reset_flag_same_as_default(
+        self, tmp_path: Path, claude_subprocess: Mock
+    ) -> None:
         """The --reset flag explicitly ensures fresh sessions (same as default)."""
         prompt_file = tmp_path / "LOOP-PROMPT.md"
         prompt_file.write_text("test prompt")
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n- [ ] task1\n")
 
-        def mock_subprocess_run(cmd, **kwargs):
-            tasks_file.write_text("# Tasks\n\n## Done\n\n- [x] task1\n")
-            return MagicMock(returncode=0)
-
-        with patch("wiggum.agents.check_cli_available", return_value=True):
-
-
-            with patch(
-            "wiggum.agents_claude.subprocess.run", side_effect=mock_subprocess_run
-        ) as mock_run:
-
+        claude_subprocess.side_effect = _write_tasks_per_call(
+            tasks_file, "# Tasks\n\n## Done\n\n- [x] task1\n"
+        )
 
-                result = runner.invoke(
-                app,
-                [
-                    "run",
-                    "-f",
-                    str(prompt_file),
-                    "--tasks",
-                    str(tasks_file),
-                    "-n",
-                    "5",
-                    "--reset",
-                    "--force",
-                    "--no-branch",
-                ],
-            )
+        result = runner.invoke(
+            cli,
+            [
+                "run",
+                "-f",
+                str(prompt_file),
+                "--tasks",
+                str(tasks_file),
+                "-n",
+                "5",
+                "--reset",
+                "--force",
+                "--no-branch",
+            ],
+        )
 
         assert result.exit_code == 0
         # Call should NOT have -c flag
-        first_call_args = mock_run.call_args_list[0][0][0]
+        first_call_args = claude_subprocess.call_args_list[0].args[0]
         assert "-c" not in first_call_args
 
 
 class TestContinueAndResetMutualExclusion:
     """Tests for mutual exclusion of --continue and --reset flags."""
 
-    def test_continue_and_reset_together_shows_error(self, tmp_path: Path) -> None:
+    def test_continue_and_reset_together_shows_error(
+        self, tmp_path: Path, claude_subprocess: Mock
+    ) -> None:
         """Using both --continue and --reset shows an error."""
         prompt_file = tmp_path / "LOOP-PROMPT.md"
         prompt_file.write_text("test prompt")
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n- [ ] task1\n")
 
-        with patch("wiggum.agents.check_cli_available", return_value=True):
-
-
-            with patch("wiggum.agents_claude.subprocess.run"):
-
-
-                result = runner.invoke(
-                app,
-                [
-                    "run",
-                    "-f",
-                    str(prompt_file),
-                    "--tasks",
-                    str(tasks_file),
-                    "--continue",
-                    "--reset",
-                ],
-            )
+        result = runner.invoke(
+            cli,
+            [
+                "run",
+                "-f",
+                str(prompt_file),
+                "--tasks",
+                str(tasks_file),
+                "--continue",
+                "--reset",
+            ],
+        )
 
         # Should show error about mutually exclusive flags
         assert result.exit_code != 0
@@ -262,7 +252,7 @@ class TestDryRunWithSessionFlags:
         prompt_file.write_text("test prompt")
 
         result = runner.invoke(
-            app,
+            cli,
             [
                 "run",
                 "-f",
@@ -282,7 +272,7 @@ class TestDryRunWithSessionFlags:
         prompt_file.write_text("test prompt")
 
         result = runner.invoke(
-            app,
+            cli,
             [
                 "run",
                 "-f",
@@ -4,13 +4,10 @@ The only stop condition is TODO.md checkmarks (besides max iterations).
 """
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
-from typer.testing import CliRunner
-
-from wiggum.cli import app, tasks_remaining
-
-runner = CliRunner()
+from tests.helpers import COMPLETED, cli, runner
+from wiggum.cli import tasks_remaining
 
 
 class TestTasksRemaining:
@@ -61,7 +58,7 @@ class TestRunStopsOnTasksComplete:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -94,7 +91,7 @@ class TestRunStopsOnTasksComplete:
             # Mark task complete after first call
             if call_count == 1:
                 tasks_file.write_text("# Tasks\n\n## Done\n\n- [x] task1\n")
-            return MagicMock(returncode=0, stdout="", stderr="")
+            return COMPLETED
 
         with patch("wiggum.agents.check_cli_available", return_value=True):
 
@@ -105,7 +102,7 @@ class TestRunStopsOnTasksComplete:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -144,7 +141,7 @@ class TestRunStopsOnTasksComplete:
                 tasks_file.write_text(
                     "# Tasks\n\n## Done\n\n- [x] task1\n- [x] task2\n"
                 )
-            return MagicMock(returncode=0, stdout="", stderr="")
+            return COMPLETED
 
         with patch("wiggum.agents.check_cli_available", return_value=True):
 
@@ -155,7 +152,7 @@ class TestRunStopsOnTasksComplete:
 
 
                 result = runner.invoke(
-                app,
+                cli,
                 [
                     "run",
                     "-f",
@@ -182,7 +179,7 @@ class TestRemovedStopConditionFlags:
         prompt_file.write_text("test prompt")
 
         result = runner.invoke(
-            app,
+            cli,
             [
                 "run",
                 "-f",
@@ -202,7 +199,7 @@ class TestRemovedStopConditionFlags:
         prompt_file.write_text("test prompt")
 
         result = runner.invoke(
-            app,
+            cli,
             [
                 "run",
                 "-f",
@@ -226,7 +223,7 @@ class TestDryRunOutput:
         prompt_file.write_text("test prompt")
 
         result = runner.invoke(
-            app,
+            cli,
             [
                 "run",
                 "-f",
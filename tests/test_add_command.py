@@ -2,43 +2,45 @@
 
 from pathlib import Path
 
-from typer.testing import CliRunner
+import pytest
 
-from wiggum.cli import app
-
-runner = CliRunner()
+from tests.helpers import cli, runner
 
 
 class TestAddCommand:
     """Tests for the `wiggum add` command."""
 
-    def test_add_task_to_existing_file(self, tmp_path: Path) -> None:
+    def test_add_task_to_existing_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Adds a task to an existing TODO.md file."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text(
             "# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n- [ ] Existing task\n"
         )
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                ["add", "New task description", "--tasks-file", str(tasks_file)],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            ["add", "New task description", "--tasks-file", str(tasks_file)],
+        )
 
         assert result.exit_code == 0
         content = tasks_file.read_text()
         assert "- [ ] New task description" in content
         assert "- [ ] Existing task" in content
 
-    def test_add_task_creates_file_if_missing(self, tmp_path: Path) -> None:
+    def test_add_task_creates_file_if_missing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Creates TODO.md with proper structure if it doesn't exist."""
         tasks_file = tmp_path / "TODO.md"
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                ["add", "First task", "--tasks-file", str(tasks_file)],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            ["add", "First task", "--tasks-file", str(tasks_file)],
+        )
 
         assert result.exit_code == 0
         assert tasks_file.exists()
@@ -47,21 +49,25 @@ class TestAddCommand:
         assert "## Todo" in content
         assert "- [ ] First task" in content
 
-    def test_add_task_to_default_file(self, tmp_path: Path) -> None:
+    def test_add_task_to_default_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Uses TODO.md in current directory by default."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n")
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Copy file into isolated filesystem
-            Path("TODO.md").write_text(tasks_file.read_text())
-            result = runner.invoke(app, ["add", "New task"])
-            content = Path("TODO.md").read_text()
+        monkeypatch.chdir(tmp_path)
+        # Copy file into isolated filesystem
+        Path("TODO.md").write_text(tasks_file.read_text())
+        result = runner.invoke(cli, ["add", "New task"])
+        content = Path("TODO.md").read_text()
 
         assert result.exit_code == 0
         assert "- [ ] New task" in content
 
-    def test_add_task_appends_to_todo_section(self, tmp_path: Path) -> None:
+    def test_add_task_appends_to_todo_section(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Task is added to the Todo section, not elsewhere."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text(
@@ -74,91 +80,101 @@ class TestAddCommand:
             "- [ ] Existing todo\n"
         )
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                ["add", "Brand new task", "--tasks-file", str(tasks_file)],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            ["add", "Brand new task", "--tasks-file", str(tasks_file)],
+        )
 
         assert result.exit_code == 0
         content = tasks_file.read_text()
         # New task should be after existing todo
         assert "- [ ] Existing todo\n- [ ] Brand new task" in content
 
-    def test_add_task_short_flag(self, tmp_path: Path) -> None:
+    def test_add_task_short_flag(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Supports -f as shorthand for --tasks-file."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n")
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                ["add", "New task", "-f", str(tasks_file)],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            ["add", "New task", "-f", str(tasks_file)],
+        )
 
         assert result.exit_code == 0
         content = tasks_file.read_text()
         assert "- [ ] New task" in content
 
-    def test_add_empty_description_fails(self, tmp_path: Path) -> None:
+    def test_add_empty_description_fails(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Rejects empty task descriptions."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n")
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                ["add", "", "--tasks-file", str(tasks_file)],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            ["add", "", "--tasks-file", str(tasks_file)],
+        )
 
         assert result.exit_code != 0
         assert "empty" in result.output.lower() or "Error" in result.output
 
-    def test_add_whitespace_only_description_fails(self, tmp_path: Path) -> None:
+    def test_add_whitespace_only_description_fails(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Rejects whitespace-only task descriptions."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n")
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                ["add", "   ", "--tasks-file", str(tasks_file)],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            ["add", "   ", "--tasks-file", str(tasks_file)],
+        )
 
         assert result.exit_code != 0
 
-    def test_add_shows_confirmation_message(self, tmp_path: Path) -> None:
+    def test_add_shows_confirmation_message(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Shows confirmation message after adding task."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n")
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                ["add", "New task", "--tasks-file", str(tasks_file)],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            ["add", "New task", "--tasks-file", str(tasks_file)],
+        )
 
         assert result.exit_code == 0
         assert "Added" in result.output or "added" in result.output
 
-    def test_add_multiple_tasks_sequentially(self, tmp_path: Path) -> None:
+    def test_add_multiple_tasks_sequentially(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Can add multiple tasks one after another."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Done\n\n## In Progress\n\n## Todo\n\n")
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            runner.invoke(
-                app,
-                ["add", "First task", "--tasks-file", str(tasks_file)],
-            )
-            runner.invoke(
-                app,
-                ["add", "Second task", "--tasks-file", str(tasks_file)],
-            )
-            runner.invoke(
-                app,
-                ["add", "Third task", "--tasks-file", str(tasks_file)],
-            )
+        monkeypatch.chdir(tmp_path)
+        runner.invoke(
+            cli,
+            ["add", "First task", "--tasks-file", str(tasks_file)],
+        )
+        runner.invoke(
+            cli,
+            ["add", "Second task", "--tasks-file", str(tasks_file)],
+        )
+        runner.invoke(
+            cli,
+            ["add", "Third task", "--tasks-file", str(tasks_file)],
+        )
 
         content = tasks_file.read_text()
         assert "- [ ] First task" in content
@@ -170,23 +186,27 @@ class TestAddCommand:
         third_pos = content.find("Third task")
         assert first_pos < second_pos < third_pos
 
-    def test_add_handles_file_without_todo_section(self, tmp_path: Path) -> None:
+    def test_add_handles_file_without_todo_section(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Handles files that exist but don't have a Todo section."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\nSome random content\n")
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                ["add", "New task", "--tasks-file", str(tasks_file)],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            ["add", "New task", "--tasks-file", str(tasks_file)],
+        )
 
         assert result.exit_code == 0
         content = tasks_file.read_text()
         assert "## Todo" in content
         assert "- [ ] New task" in content
 
-    def test_add_preserves_existing_content(self, tmp_path: Path) -> None:
+    def test_add_preserves_existing_content(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Adding a task doesn't modify other content."""
         original_content = (
             "# Tasks\n\n"
@@ -200,11 +220,11 @@ class TestAddCommand:
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text(original_content)
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                ["add", "New task", "--tasks-file", str(tasks_file)],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            ["add", "New task", "--tasks-file", str(tasks_file)],
+        )
 
         assert result.exit_code == 0
         content = tasks_file.read_text()
@@ -2,8 +2,9 @@
 
 from pathlib import Path
 
-from typer.testing import CliRunner
+import pytest
 
+from tests.helpers import cli, runner
 from wiggum.changelog import (
     categorize_task,
     clear_done_tasks,
@@ -12,9 +13,6 @@ from wiggum.changelog import (
     parse_existing_changelog,
     tasks_to_changelog_entries,
 )
-from wiggum.cli import app
-
-runner = CliRunner()
 
 
 class TestCategorizeTask:
@@ -256,7 +254,9 @@ class TestMergeChangelog:
 class TestChangelogCommand:
     """Tests for the `wiggum changelog` CLI command."""
 
-    def test_generates_changelog_from_done_tasks(self, tmp_path: Path) -> None:
+    def test_generates_changelog_from_done_tasks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Generates changelog from completed tasks."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text(
@@ -268,18 +268,18 @@ class TestChangelogCommand:
         )
         output_file = tmp_path / "CHANGELOG.md"
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                [
-                    "changelog",
-                    "--tasks-file",
-                    str(tasks_file),
-                    "--output",
-                    str(output_file),
-                    "--force",
-                ],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            [
+                "changelog",
+                "--tasks-file",
+                str(tasks_file),
+                "--output",
+                str(output_file),
+                "--force",
+            ],
+        )
 
         assert result.exit_code == 0
         assert output_file.exists()
@@ -289,57 +289,61 @@ class TestChangelogCommand:
         assert "Add new feature" in content
         assert "Fix critical bug" in content
 
-    def test_dry_run_does_not_write(self, tmp_path: Path) -> None:
+    def test_dry_run_does_not_write(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """--dry-run shows preview without writing file."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Done\n\n- [x] Add feature\n\n## Todo\n\n")
         output_file = tmp_path / "CHANGELOG.md"
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                [
-                    "changelog",
-                    "--tasks-file",
-                    str(tasks_file),
-                    "--output",
-                    str(output_file),
-                    "--dry-run",
-                ],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            [
+                "changelog",
+                "--tasks-file",
+                str(tasks_file),
+                "--output",
+                str(output_file),
+                "--dry-run",
+            ],
+        )
 
         assert result.exit_code == 0
         assert "Preview:" in result.output
         assert "Add feature" in result.output
         assert not output_file.exists()
 
-    def test_version_flag(self, tmp_path: Path) -> None:
+    def test_version_flag(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """--version creates versioned section."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Done\n\n- [x] Add feature\n\n## Todo\n\n")
         output_file = tmp_path / "CHANGELOG.md"
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                [
-                    "changelog",
-                    "--tasks-file",
-                    str(tasks_file),
-                    "--output",
-                    str(output_file),
-                    "--version",
-                    "0.8.0",
-                    "--force",
-                ],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            [
+                "changelog",
+                "--tasks-file",
+                str(tasks_file),
+                "--output",
+                str(output_file),
+                "--version",
+                "0.8.0",
+                "--force",
+            ],
+        )
 
         assert result.exit_code == 0
         content = output_file.read_text()
         assert "[0.8.0]" in content
         assert "Unreleased" not in content
 
-    def test_append_mode(self, tmp_path: Path) -> None:
+    def test_append_mode(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """--append adds to existing changelog."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text(
@@ -353,25 +357,27 @@ class TestChangelogCommand:
             "- Existing feature\n"
         )
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                [
-                    "changelog",
-                    "--tasks-file",
-                    str(tasks_file),
-                    "--output",
-                    str(output_file),
-                    "--append",
-                ],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            [
+                "changelog",
+                "--tasks-file",
+                str(tasks_file),
+                "--output",
+                str(output_file),
+                "--append",
+            ],
+        )
 
         assert result.exit_code == 0
         content = output_file.read_text()
         assert "Existing feature" in content
         assert "Add new feature" in content
 
-    def test_clear_done_flag(self, tmp_path: Path) -> None:
+    def test_clear_done_flag(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """--clear-done removes tasks from Done section."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text(
@@ -383,19 +389,19 @@ class TestChangelogCommand:
         )
         output_file = tmp_path / "CHANGELOG.md"
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                [
-                    "changelog",
-                    "--tasks-file",
-                    str(tasks_file),
-                    "--output",
-                    str(output_file),
-                    "--clear-done",
-                    "--force",
-                ],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            [
+                "changelog",
+                "--tasks-file",
+                str(tasks_file),
+                "--output",
+                str(output_file),
+                "--clear-done",
+                "--force",
+            ],
+        )
 
         assert result.exit_code == 0
         assert "Cleared Done section" in result.output
@@ -404,21 +410,25 @@ class TestChangelogCommand:
         assert "Completed task" not in tasks_content
         assert "Pending task" in tasks_content
 
-    def test_no_done_tasks_exits_cleanly(self, tmp_path: Path) -> None:
+    def test_no_done_tasks_exits_cleanly(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Exits with message when no completed tasks."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Done\n\n## Todo\n\n- [ ] Task\n")
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                ["changelog", "--tasks-file", str(tasks_file)],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            ["changelog", "--tasks-file", str(tasks_file)],
+        )
 
         assert result.exit_code == 0
         assert "No completed tasks" in result.output
 
-    def test_checked_tasks_outside_done_are_ignored(self, tmp_path: Path) -> None:
+    def test_checked_tasks_outside_done_are_ignored(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Only checked tasks in the Done section should be used."""
         tasks_file = tmp_path / "TASKS.md"
         tasks_file.write_text(
@@ -426,35 +436,39 @@ class TestChangelogCommand:
         )
         output_file = tmp_path / "CHANGELOG.md"
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                [
-                    "changelog",
-                    "--tasks-file",
-                    str(tasks_file),
-                    "--output",
-                    str(output_file),
-                    "--force",
-                ],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            [
+                "changelog",
+                "--tasks-file",
+                str(tasks_file),
+                "--output",
+                str(output_file),
+                "--force",
+            ],
+        )
 
         assert result.exit_code == 0
         assert "No completed tasks" in result.output
         assert not output_file.exists()
 
-    def test_missing_tasks_file_error(self, tmp_path: Path) -> None:
+    def test_missing_tasks_file_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Shows error when tasks file doesn't exist."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                ["changelog", "--tasks-file", "nonexistent.md"],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            ["changelog", "--tasks-file", "nonexistent.md"],
+        )
 
         assert result.exit_code == 1
         assert "No tasks file found" in result.output
 
-    def test_shows_task_summary(self, tmp_path: Path) -> None:
+    def test_shows_task_summary(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Shows summary of categorized tasks."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text(
@@ -467,60 +481,64 @@ class TestChangelogCommand:
         )
         output_file = tmp_path / "CHANGELOG.md"
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            result = runner.invoke(
-                app,
-                [
-                    "changelog",
-                    "--tasks-file",
-                    str(tasks_file),
-                    "--output",
-                    str(output_file),
-                    "--force",
-                ],
-            )
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(
+            cli,
+            [
+                "changelog",
+                "--tasks-file",
+                str(tasks_file),
+                "--output",
+                str(output_file),
+                "--force",
+            ],
+        )
 
         assert result.exit_code == 0
         assert "3 task(s)" in result.output
         assert "added" in result.output.lower()
         assert "fixed" in result.output.lower()
 
-    def test_prompts_before_overwrite(self, tmp_path: Path) -> None:
+    def test_prompts_before_overwrite(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Prompts for confirmation before overwriting existing file."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Done\n\n- [x] Add feature\n\n## Todo\n\n")
         output_file = tmp_path / "CHANGELOG.md"
         output_file.write_text("# Existing changelog\n")
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Answer 'n' to confirmation
-            result = runner.invoke(
-                app,
-                [
-                    "changelog",
-                    "--tasks-file",
-                    str(tasks_file),
-                    "--output",
-                    str(output_file),
-                ],
-                input="n\n",
-            )
+        monkeypatch.chdir(tmp_path)
+        # Answer 'n' to confirmation
+        result = runner.invoke(
+            cli,
+            [
+                "changelog",
+                "--tasks-file",
+                str(tasks_file),
+                "--output",
+                str(output_file),
+            ],
+            input="n\n",
+        )
 
         assert result.exit_code == 0
         assert "Aborted" in result.output
         # File should not be modified
         assert "Existing changelog" in output_file.read_text()
 
-    def test_default_files(self, tmp_path: Path) -> None:
+    def test_default_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Uses TODO.md and CHANGELOG.md by default."""
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("TODO.md").write_text(
-                "# Tasks\n\n## Done\n\n- [x] Add feature\n\n## Todo\n\n"
-            )
-            result = runner.invoke(app, ["changelog", "--force"])
-
-            assert result.exit_code == 0
-            assert Path("CHANGELOG.md").exists()
+        monkeypatch.chdir(tmp_path)
+        Path("TODO.md").write_text(
+            "# Tasks\n\n## Done\n\n- [x] Add feature\n\n## Todo\n\n"
+        )
+        result = runner.invoke(cli, ["changelog", "--force"])
+
+        assert result.exit_code == 0
+        assert Path("CHANGELOG.md").exists()
 
 
 class TestClearDoneTasks:
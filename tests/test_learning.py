@@ -1,6 +1,5 @@
 """Tests for the learning diary feature."""
 
-import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -15,14 +14,6 @@ from wiggum.learning import (
 )
 
 
-@pytest.fixture(autouse=True)
-def restore_cwd():
-    """Restore working directory after each test."""
-    original_cwd = os.getcwd()
-    yield
-    os.chdir(original_cwd)
-
-
 class TestEnsureDiaryDir:
     """Tests for ensure_diary_dir function."""
 
@@ -170,19 +161,21 @@ class TestConsolidateLearnings:
     """Tests for consolidate_learnings function."""
 
     def test_returns_failure_with_reason_when_no_diary_content(
-        self, tmp_path: Path
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Returns (False, reason) when diary has no content."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
 
         success, reason = consolidate_learnings(agent_name=None, yolo=True)
 
         assert success is False
         assert reason == "no diary content"
 
-    def test_calls_agent_with_correct_prompt(self, tmp_path: Path) -> None:
+    def test_calls_agent_with_correct_prompt(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Calls agent with diary content and CLAUDE.md content."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         # Set up diary
         (tmp_path / ".wiggum").mkdir()
         diary_content = "### Learning: Test\n**Context**: Test"
@@ -213,10 +206,10 @@ class TestConsolidateLearnings:
         assert config.yolo is True
 
     def test_prompt_uses_delimiters_for_injection_protection(
-        self, tmp_path: Path
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Prompt wraps content in delimiters to prevent prompt injection."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         (tmp_path / ".wiggum").mkdir()
         (tmp_path / ".wiggum" / "session-diary.md").write_text("diary content")
         (tmp_path / "CLAUDE.md").write_text("claude content")
@@ -243,9 +236,11 @@ class TestConsolidateLearnings:
         # Should have line delimiters
         assert "=" * 40 in config.prompt
 
-    def test_returns_failure_with_reason_on_agent_failure(self, tmp_path: Path) -> None:
+    def test_returns_failure_with_reason_on_agent_failure(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Returns (False, reason) when agent returns non-zero exit code."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         (tmp_path / ".wiggum").mkdir()
         (tmp_path / ".wiggum" / "session-diary.md").write_text("some content")
 
@@ -266,10 +261,10 @@ class TestConsolidateLearnings:
         assert reason == "agent failed with exit code 1"
 
     def test_returns_failure_with_reason_when_template_missing(
-        self, tmp_path: Path
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Returns (False, reason) when CONSOLIDATE-PROMPT.md template is missing."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         (tmp_path / ".wiggum").mkdir()
         (tmp_path / ".wiggum" / "session-diary.md").write_text("some content")
 
@@ -285,9 +280,11 @@ class TestConsolidateLearnings:
         assert success is False
         assert reason == "consolidation template not found"
 
-    def test_handles_missing_claude_md(self, tmp_path: Path) -> None:
+    def test_handles_missing_claude_md(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Works when CLAUDE.md doesn't exist."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         (tmp_path / ".wiggum").mkdir()
         (tmp_path / ".wiggum" / "session-diary.md").write_text("diary content")
 
@@ -339,11 +336,13 @@ class TestLearningConfigResolution:
             "no_keep_diary": False,
         }
 
-    def test_diary_and_no_diary_mutually_exclusive(self, tmp_path: Path) -> None:
+    def test_diary_and_no_diary_mutually_exclusive(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Cannot use --diary and --no-diary together."""
         from wiggum.config import resolve_run_config
 
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         args = self._base_config_args()
         args["diary"] = True
         args["no_diary"] = True
@@ -352,12 +351,12 @@ class TestLearningConfigResolution:
             resolve_run_config(**args)
 
     def test_keep_diary_and_no_keep_diary_mutually_exclusive(
-        self, tmp_path: Path
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Cannot use --keep-diary and --no-keep-diary together."""
         from wiggum.config import resolve_run_config
 
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         args = self._base_config_args()
         args["keep_diary_flag"] = True
         args["no_keep_diary"] = True
@@ -365,11 +364,13 @@ class TestLearningConfigResolution:
         with pytest.raises(ValueError, match="mutually exclusive"):
             resolve_run_config(**args)
 
-    def test_diary_flag_enables_learning(self, tmp_path: Path) -> None:
+    def test_diary_flag_enables_learning(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """--diary flag enables learning even when config disables it."""
         from wiggum.config import resolve_run_config, write_config
 
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         write_config({"learning": {"enabled": False}})
         args = self._base_config_args()
         args["diary"] = True
@@ -378,11 +379,13 @@ class TestLearningConfigResolution:
 
         assert cfg.learning_enabled is True
 
-    def test_no_diary_flag_disables_learning(self, tmp_path: Path) -> None:
+    def test_no_diary_flag_disables_learning(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """--no-diary flag disables learning."""
         from wiggum.config import resolve_run_config
 
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         args = self._base_config_args()
         args["no_diary"] = True
 
@@ -390,11 +393,13 @@ class TestLearningConfigResolution:
 
         assert cfg.learning_enabled is False
 
-    def test_keep_diary_flag_overrides_config(self, tmp_path: Path) -> None:
+    def test_keep_diary_flag_overrides_config(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """--keep-diary flag overrides config setting."""
         from wiggum.config import resolve_run_config, write_config
 
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         write_config({"learning": {"keep_diary": False}})
         args = self._base_config_args()
         args["keep_diary_flag"] = True
@@ -403,11 +408,13 @@ class TestLearningConfigResolution:
 
         assert cfg.keep_diary is True
 
-    def test_no_keep_diary_flag_overrides_config(self, tmp_path: Path) -> None:
+    def test_no_keep_diary_flag_overrides_config(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """--no-keep-diary flag overrides config setting."""
         from wiggum.config import resolve_run_config
 
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         args = self._base_config_args()
         args["no_keep_diary"] = True
 
@@ -415,11 +422,13 @@ class TestLearningConfigResolution:
 
         assert cfg.keep_diary is False
 
-    def test_learning_defaults_enabled(self, tmp_path: Path) -> None:
+    def test_learning_defaults_enabled(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Learning is enabled by default, but keep_diary is False."""
         from wiggum.config import resolve_run_config
 
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
         args = self._base_config_args()
 
         cfg = resolve_run_config(**args)
@@ -3,17 +3,17 @@
 from pathlib import Path
 from unittest.mock import patch
 
-from typer.testing import CliRunner
+import pytest
 
-from wiggum.cli import app
-
-runner = CliRunner()
+from tests.helpers import cli, runner
 
 
 class TestSuggestCommand:
     """Tests for the `wiggum suggest` command."""
 
-    def test_suggest_displays_found_tasks(self, tmp_path: Path) -> None:
+    def test_suggest_displays_found_tasks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Displays task suggestions from Claude."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n")
@@ -29,21 +29,23 @@ class TestSuggestCommand:
 security_mode: conservative
 ```"""
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["suggest", "--tasks-file", str(tasks_file), "--yes"],
-                )
+        monkeypatch.chdir(tmp_path)
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(
+                cli,
+                ["suggest", "--tasks-file", str(tasks_file), "--yes"],
+            )
 
         assert result.exit_code == 0
         assert "First suggested task" in result.output
         assert "Second suggested task" in result.output
 
-    def test_suggest_adds_tasks_with_yes_flag(self, tmp_path: Path) -> None:
+    def test_suggest_adds_tasks_with_yes_flag(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Adds all tasks without prompting when --yes is used."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n")
@@ -59,22 +61,24 @@ security_mode: conservative
 security_mode: yolo
 ```"""
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["suggest", "--tasks-file", str(tasks_file), "--yes"],
-                )
+        monkeypatch.chdir(tmp_path)
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(
+                cli,
+                ["suggest", "--tasks-file", str(tasks_file), "--yes"],
+            )
 
         assert result.exit_code == 0
         content = tasks_file.read_text()
         assert "- [ ] Task one" in content
         assert "- [ ] Task two" in content
 
-    def test_suggest_skips_existing_tasks(self, tmp_path: Path) -> None:
+    def test_suggest_skips_existing_tasks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Does not add tasks that already exist in TODO.md."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n- [ ] Existing task\n")
@@ -90,15 +94,15 @@ security_mode: yolo
 security_mode: conservative
 ```"""
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["suggest", "--tasks-file", str(tasks_file), "--yes"],
-                )
+        monkeypatch.chdir(tmp_path)
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(
+                cli,
+                ["suggest", "--tasks-file", str(tasks_file), "--yes"],
+            )
 
         assert result.exit_code == 0
         content = tasks_file.read_text()
@@ -107,7 +111,9 @@ security_mode: conservative
         # Should only have one instance of existing task
         assert content.count("Existing task") == 1
 
-    def test_suggest_shows_count_of_new_tasks(self, tmp_path: Path) -> None:
+    def test_suggest_shows_count_of_new_tasks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Shows the number of new tasks found."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n")
@@ -124,20 +130,22 @@ security_mode: conservative
 security_mode: conservative
 ```"""
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["suggest", "--tasks-file", str(tasks_file), "--yes"],
-                )
+        monkeypatch.chdir(tmp_path)
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(
+                cli,
+                ["suggest", "--tasks-file", str(tasks_file), "--yes"],
+            )
 
         assert result.exit_code == 0
         assert "3 new task suggestion" in result.output
 
-    def test_suggest_shows_added_count(self, tmp_path: Path) -> None:
+    def test_suggest_shows_added_count(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Shows the count of tasks actually added."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n")
@@ -152,20 +160,22 @@ security_mode: conservative
 security_mode: conservative
 ```"""
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["suggest", "--tasks-file", str(tasks_file), "--yes"],
-                )
+        monkeypatch.chdir(tmp_path)
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(
+                cli,
+                ["suggest", "--tasks-file", str(tasks_file), "--yes"],
+            )
 
         assert result.exit_code == 0
         assert "Added 1 task(s)" in result.output
 
-    def test_suggest_all_tasks_exist_message(self, tmp_path: Path) -> None:
+    def test_suggest_all_tasks_exist_message(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Shows message when all suggested tasks already exist."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text(
@@ -183,20 +193,22 @@ security_mode: conservative
 security_mode: conservative
 ```"""
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["suggest", "--tasks-file", str(tasks_file), "--yes"],
-                )
+        monkeypatch.chdir(tmp_path)
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(
+                cli,
+                ["suggest", "--tasks-file", str(tasks_file), "--yes"],
+            )
 
         assert result.exit_code == 0
         assert "All suggested tasks already exist" in result.output
 
-    def test_suggest_no_tasks_message(self, tmp_path: Path) -> None:
+    def test_suggest_no_tasks_message(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Shows message when no tasks are suggested."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n")
@@ -209,39 +221,43 @@ security_mode: conservative
 security_mode: conservative
 ```"""
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["suggest", "--tasks-file", str(tasks_file), "--yes"],
-                )
+        monkeypatch.chdir(tmp_path)
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(
+                cli,
+                ["suggest", "--tasks-file", str(tasks_file), "--yes"],
+            )
 
         assert result.exit_code == 0
         assert "No tasks suggested" in result.output
 
-    def test_suggest_handles_claude_failure(self, tmp_path: Path) -> None:
+    def test_suggest_handles_claude_failure(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Handles case when Claude CLI is not available."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n")
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(None, "Error: 'claude' command not found."),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["suggest", "--tasks-file", str(tasks_file), "--yes"],
-                )
+        monkeypatch.chdir(tmp_path)
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(None, "Error: 'claude' command not found."),
+        ):
+            result = runner.invoke(
+                cli,
+                ["suggest", "--tasks-file", str(tasks_file), "--yes"],
+            )
 
         assert result.exit_code == 1
         assert "claude" in result.output.lower()
         assert "not found" in result.output.lower()
 
-    def test_suggest_uses_default_tasks_file(self, tmp_path: Path) -> None:
+    def test_suggest_uses_default_tasks_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Uses TODO.md in current directory by default."""
         mock_output = """```markdown
 ## Tasks
@@ -253,19 +269,21 @@ security_mode: conservative
 security_mode: conservative
 ```"""
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n")
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(app, ["suggest", "--yes"])
-            content = Path("TODO.md").read_text()
+        monkeypatch.chdir(tmp_path)
+        Path("TODO.md").write_text("# Tasks\n\n## Todo\n\n")
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(cli, ["suggest", "--yes"])
+        content = Path("TODO.md").read_text()
 
         assert result.exit_code == 0
         assert "- [ ] A task" in content
 
-    def test_suggest_short_flag(self, tmp_path: Path) -> None:
+    def test_suggest_short_flag(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Supports -f as shorthand for --tasks-file."""
         tasks_file = tmp_path / "custom.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n")
@@ -280,21 +298,23 @@ security_mode: conservative
 security_mode: conservative
 ```"""
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["suggest", "-f", str(tasks_file), "-y"],
-                )
+        monkeypatch.chdir(tmp_path)
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(
+                cli,
+                ["suggest", "-f", str(tasks_file), "-y"],
+            )
 
         assert result.exit_code == 0
         content = tasks_file.read_text()
         assert "- [ ] Custom task" in content
 
-    def test_suggest_creates_tasks_file_if_missing(self, tmp_path: Path) -> None:
+    def test_suggest_creates_tasks_file_if_missing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Creates TODO.md if it doesn't exist."""
         tasks_file = tmp_path / "TODO.md"
 
@@ -308,22 +328,24 @@ security_mode: conservative
 security_mode: conservative
 ```"""
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["suggest", "--tasks-file", str(tasks_file), "--yes"],
-                )
+        monkeypatch.chdir(tmp_path)
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(
+                cli,
+                ["suggest", "--tasks-file", str(tasks_file), "--yes"],
+            )
 
         assert result.exit_code == 0
         assert tasks_file.exists()
         content = tasks_file.read_text()
         assert "- [ ] New task" in content
 
-    def test_suggest_case_insensitive_duplicate_check(self, tmp_path: Path) -> None:
+    def test_suggest_case_insensitive_duplicate_check(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Duplicate check is case-insensitive."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n- [ ] Fix the BUG\n")
@@ -339,15 +361,15 @@ security_mode: conservative
 security_mode: conservative
 ```"""
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["suggest", "--tasks-file", str(tasks_file), "--yes"],
-                )
+        monkeypatch.chdir(tmp_path)
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(
+                cli,
+                ["suggest", "--tasks-file", str(tasks_file), "--yes"],
+            )
 
         assert result.exit_code == 0
         content = tasks_file.read_text()
@@ -356,7 +378,9 @@ security_mode: conservative
         # Should have new task
         assert "- [ ] New task" in content
 
-    def test_suggest_interactive_mode_prompts(self, tmp_path: Path) -> None:
+    def test_suggest_interactive_mode_prompts(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Interactive mode prompts for each task."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n")
@@ -372,17 +396,17 @@ security_mode: conservative
 security_mode: conservative
 ```"""
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                # Accept first, reject second
-                result = runner.invoke(
-                    app,
-                    ["suggest", "--tasks-file", str(tasks_file)],
-                    input="y\nn\n",
-                )
+        monkeypatch.chdir(tmp_path)
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            # Accept first, reject second
+            result = runner.invoke(
+                cli,
+                ["suggest", "--tasks-file", str(tasks_file)],
+                input="y\nn\n",
+            )
 
         assert result.exit_code == 0
         content = tasks_file.read_text()
@@ -390,7 +414,9 @@ security_mode: conservative
         assert "Second task" not in content
         assert "Added 1 task(s)" in result.output
 
-    def test_suggest_interactive_skip_all(self, tmp_path: Path) -> None:
+    def test_suggest_interactive_skip_all(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Interactive mode can skip all tasks."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n")
@@ -406,16 +432,16 @@ security_mode: conservative
 security_mode: conservative
 ```"""
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            with patch(
-                "wiggum.runner.run_claude_for_planning",
-                return_value=(mock_output, None),
-            ):
-                result = runner.invoke(
-                    app,
-                    ["suggest", "--tasks-file", str(tasks_file)],
-                    input="n\nn\n",
-                )
+        monkeypatch.chdir(tmp_path)
+        with patch(
+            "wiggum.runner.run_claude_for_planning",
+            return_value=(mock_output, None),
+        ):
+            result = runner.invoke(
+                cli,
+                ["suggest", "--tasks-file", str(tasks_file)],
+                input="n\nn\n",
+            )
 
         assert result.exit_code == 0
         content = tasks_file.read_text()
@@ -423,7 +449,9 @@ security_mode: conservative
         assert "Task two" not in content
         assert "Added 0 task(s)" in result.output
 
-    def test_suggest_uses_readme_for_context(self, tmp_path: Path) -> None:
+    def test_suggest_uses_readme_for_context(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Uses README.md content for context if available."""
         tasks_file = tmp_path / "TODO.md"
         tasks_file.write_text("# Tasks\n\n## Todo\n\n")
@@ -446,16 +474,14 @@ security_mode: conservative
             captured_prompt.append(prompt)
             return (mock_output, None)
 
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Copy README to isolated filesystem
-            Path("README.md").write_text(readme_file.read_text())
-            with patch(
-                "wiggum.runner.run_claude_for_planning", side_effect=capture_prompt
-            ):
-                runner.invoke(
-                    app,
-                    ["suggest", "--tasks-file", str(tasks_file), "--yes"],
-                )
+        monkeypatch.chdir(tmp_path)
+        # Copy README to isolated filesystem
+        Path("README.md").write_text(readme_file.read_text())
+        with patch("wiggum.runner.run_claude_for_planning", side_effect=capture_prompt):
+            runner.invoke(
+                cli,
+                ["suggest", "--tasks-file", str(tasks_file), "--yes"],
+            )
 
         # Verify README content was included in the prompt
         assert len(captured_prompt) == 1
@@ -1,11 +1,10 @@
 """Tests for the upgrade command."""
 
 from pathlib import Path
-from typer.testing import CliRunner
 
-from wiggum.cli import app
+import pytest
 
-runner = CliRunner()
+from tests.helpers import cli, runner
 
 
 class TestUpgradeCommand:
@@ -13,209 +12,163 @@ class TestUpgradeCommand:
 
     def test_upgrade_shows_help(self) -> None:
         """Test that upgrade command has help text."""
-        result = runner.invoke(app, ["upgrade", "--help"])
+        result = runner.invoke(cli, ["upgrade", "--help"])
         assert result.exit_code == 0
         assert "upgrade" in result.output.lower()
 
-    def test_upgrade_no_files_suggests_init(self, tmp_path: Path) -> None:
+    def test_upgrade_no_files_suggests_init(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test upgrade when no wiggum files exist suggests running init."""
-        import os
-
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-        try:
-            result = runner.invoke(app, ["upgrade"])
-            assert result.exit_code == 1
-            assert "wiggum init" in result.output.lower()
-        finally:
-            os.chdir(original_cwd)
-
-    def test_upgrade_dry_run_shows_changes(self, tmp_path: Path) -> None:
+        monkeypatch.chdir(tmp_path)
+        result = runner.invoke(cli, ["upgrade"])
+        assert result.exit_code == 1
+        assert "wiggum init" in result.output.lower()
+
+    def test_upgrade_dry_run_shows_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that --dry-run shows changes without modifying."""
-        import os
-
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-        try:
-            # Create an old version LOOP-PROMPT.md
-            prompt_file = tmp_path / "LOOP-PROMPT.md"
-            prompt_file.write_text("Old content\n<!-- wiggum-template: 0.4.0 -->")
-
-            result = runner.invoke(app, ["upgrade", "--dry-run"])
-
-            # Should show what would change
-            assert "LOOP-PROMPT.md" in result.output
-            # Should not modify the file
-            assert (
-                prompt_file.read_text()
-                == "Old content\n<!-- wiggum-template: 0.4.0 -->"
-            )
-        finally:
-            os.chdir(original_cwd)
-
-    def test_upgrade_creates_backup(self, tmp_path: Path) -> None:
+        monkeypatch.chdir(tmp_path)
+        # Create an old version LOOP-PROMPT.md
+        prompt_file = tmp_path / "LOOP-PROMPT.md"
+        prompt_file.write_text("Old content\n<!-- wiggum-template: 0.4.0 -->")
+
+        result = runner.invoke(cli, ["upgrade", "--dry-run"])
+
+        # Should show what would change
+        assert "LOOP-PROMPT.md" in result.output
+        # Should not modify the file
+        assert prompt_file.read_text() == "Old content\n<!-- wiggum-template: 0.4.0 -->"
+
+    def test_upgrade_creates_backup(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that upgrade creates backup of LOOP-PROMPT.md."""
-        import os
-
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-        try:
-            # Create an old version LOOP-PROMPT.md
-            prompt_file = tmp_path / "LOOP-PROMPT.md"
-            old_content = "Old content\n<!-- wiggum-template: 0.4.0 -->"
-            prompt_file.write_text(old_content)
-
-            runner.invoke(app, ["upgrade", "--force"])
-
-            # Should create backup
-            backup_file = tmp_path / "LOOP-PROMPT.md.bak"
-            assert backup_file.exists()
-            assert backup_file.read_text() == old_content
-        finally:
-            os.chdir(original_cwd)
-
-    def test_upgrade_no_backup_flag(self, tmp_path: Path) -> None:
+        monkeypatch.chdir(tmp_path)
+        # Create an old version LOOP-PROMPT.md
+        prompt_file = tmp_path / "LOOP-PROMPT.md"
+        old_content = "Old content\n<!-- wiggum-template: 0.4.0 -->"
+        prompt_file.write_text(old_content)
+
+        runner.invoke(cli, ["upgrade", "--force"])
+
+        # Should create backup
+        backup_file = tmp_path / "LOOP-PROMPT.md.bak"
+        assert backup_file.exists()
+        assert backup_file.read_text() == old_content
+
+    def test_upgrade_no_backup_flag(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that --no-backup skips backup creation."""
-        import os
-
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-        try:
-            prompt_file = tmp_path / "LOOP-PROMPT.md"
-            prompt_file.write_text("Old content\n<!-- wiggum-template: 0.4.0 -->")
+        monkeypatch.chdir(tmp_path)
+        prompt_file = tmp_path / "LOOP-PROMPT.md"
+        prompt_file.write_text("Old content\n<!-- wiggum-template: 0.4.0 -->")
 
-            runner.invoke(app, ["upgrade", "--force", "--no-backup"])
+        runner.invoke(cli, ["upgrade", "--force", "--no-backup"])
 
-            backup_file = tmp_path / "LOOP-PROMPT.md.bak"
-            assert not backup_file.exists()
-        finally:
-            os.chdir(original_cwd)
+        backup_file = tmp_path / "LOOP-PROMPT.md.bak"
+        assert not backup_file.exists()
 
-    def test_upgrade_force_skips_confirmation(self, tmp_path: Path) -> None:
+    def test_upgrade_force_skips_confirmation(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that --force skips confirmation prompt."""
-        import os
+        monkeypatch.chdir(tmp_path)
+        prompt_file = tmp_path / "LOOP-PROMPT.md"
+        prompt_file.write_text("Old content\n<!-- wiggum-template: 0.4.0 -->")
 
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-        try:
-            prompt_file = tmp_path / "LOOP-PROMPT.md"
-            prompt_file.write_text("Old content\n<!-- wiggum-template: 0.4.0 -->")
+        result = runner.invoke(cli, ["upgrade", "--force"])
 
-            result = runner.invoke(app, ["upgrade", "--force"])
-
-            # Should not ask for confirmation
-            assert "Upgrade?" not in result.output
-            assert result.exit_code == 0
-        finally:
-            os.chdir(original_cwd)
+        # Should not ask for confirmation
+        assert "Upgrade?" not in result.output
+        assert result.exit_code == 0
 
-    def test_upgrade_prompt_only(self, tmp_path: Path) -> None:
+    def test_upgrade_prompt_only(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that 'upgrade prompt' only upgrades LOOP-PROMPT.md."""
-        import os
-
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-        try:
-            prompt_file = tmp_path / "LOOP-PROMPT.md"
-            prompt_file.write_text("Old content\n<!-- wiggum-template: 0.4.0 -->")
+        monkeypatch.chdir(tmp_path)
+        prompt_file = tmp_path / "LOOP-PROMPT.md"
+        prompt_file.write_text("Old content\n<!-- wiggum-template: 0.4.0 -->")
 
-            config_file = tmp_path / ".wiggum.toml"
-            config_content = "[security]\nyolo = true\n"
-            config_file.write_text(config_content)
+        config_file = tmp_path / ".wiggum.toml"
+        config_content = "[security]\nyolo = true\n"
+        config_file.write_text(config_content)
 
-            result = runner.invoke(app, ["upgrade", "prompt", "--force"])
+        result = runner.invoke(cli, ["upgrade", "prompt", "--force"])
 
-            # LOOP-PROMPT.md should be updated
-            assert "wiggum-template: 0.6.0" in prompt_file.read_text()
-            # Config should be unchanged
-            assert config_file.read_text() == config_content
-        finally:
-            os.chdir(original_cwd)
+        # LOOP-PROMPT.md should be updated
+        assert "wiggum-template: 0.6.0" in prompt_file.read_text()
+        # Config should be unchanged
+        assert config_file.read_text() == config_content
 
-    def test_upgrade_config_only(self, tmp_path: Path) -> None:
+    def test_upgrade_config_only(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that 'upgrade config' only upgrades .wiggum.toml."""
-        import os
+        monkeypatch.chdir(tmp_path)
+        prompt_file = tmp_path / "LOOP-PROMPT.md"
+        old_prompt = "Old content\n<!-- wiggum-template: 0.4.0 -->"
+        prompt_file.write_text(old_prompt)
 
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-        try:
-            prompt_file = tmp_path / "LOOP-PROMPT.md"
-            old_prompt = "Old content\n<!-- wiggum-template: 0.4.0 -->"
-            prompt_file.write_text(old_prompt)
+        config_file = tmp_path / ".wiggum.toml"
+        config_file.write_text("[security]\nyolo = true\n")
 
-            config_file = tmp_path / ".wiggum.toml"
-            config_file.write_text("[security]\nyolo = true\n")
+        runner.invoke(cli, ["upgrade", "config", "--force"])
 
-            runner.invoke(app, ["upgrade", "config", "--force"])
+        # LOOP-PROMPT.md should be unchanged
+        assert prompt_file.read_text() == old_prompt
+        # Config should have new options
+        assert "[security]" in config_file.read_text().splitlines()
 
-            # LOOP-PROMPT.md should be unchanged
-            assert prompt_file.read_text() == old_prompt
-            # Config should have new options
-            config_content = config_file.read_text()
-            assert "security" in config_content
-        finally:
-            os.chdir(original_cwd)
-
-    def test_upgrade_preserves_user_values(self, tmp_path: Path) -> None:
+    def test_upgrade_preserves_user_values(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that upgrade preserves existing user config values."""
-        import os
-
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-        try:
-            config_file = tmp_path / ".wiggum.toml"
-            config_file.write_text(
-                '[security]\nyolo = true\nallow_paths = "src/"\n\n[loop]\nmax_iterations = 20\n'
-            )
-
-            runner.invoke(app, ["upgrade", "config", "--force"])
-
-            # User values should be preserved
-            config_content = config_file.read_text()
-            assert "yolo = true" in config_content
-            assert "max_iterations = 20" in config_content
-        finally:
-            os.chdir(original_cwd)
-
-    def test_upgrade_config_uses_secure_keep_diary_default(self, tmp_path: Path) -> None:
-        """Config upgrade should default learning.keep_diary to false."""
-        import os
+        monkeypatch.chdir(tmp_path)
+        config_file = tmp_path / ".wiggum.toml"
+        config_file.write_text(
+            '[security]\nyolo = true\nallow_paths = "src/"\n\n[loop]\nmax_iterations = 20\n'
+        )
 
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-        try:
-            prompt_file = tmp_path / "LOOP-PROMPT.md"
-            prompt_file.write_text("<!-- wiggum-template: 0.9.0 -->")
+        runner.invoke(cli, ["upgrade", "config", "--force"])
 
-            config_file = tmp_path / ".wiggum.toml"
-            config_file.write_text("[security]\nyolo = false\n")
+        # User values should be preserved
+        lines = set(config_file.read_text().splitlines())
+        assert {"yolo = true", "max_iterations = 20"} <= lines
 
-            result = runner.invoke(app, ["upgrade", "config", "--force"])
+    def test_upgrade_config_uses_secure_keep_diary_default(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Config upgrade should default learning.keep_diary to false."""
+        monkeypatch.chdir(tmp_path)
+        prompt_file = tmp_path / "LOOP-PROMPT.md"
+        prompt_file.write_text("<!-- wiggum-template: 0.9.0 -->")
 
-            assert result.exit_code == 0
-            config_content = config_file.read_text()
-            assert "[learning]" in config_content
-            assert "keep_diary = false" in config_content
-        finally:
-            os.chdir(original_cwd)
+        config_file = tmp_path / ".wiggum.toml"
+        config_file.write_text("[security]\nyolo = false\n")
 
-    def test_upgrade_invalid_target(self, tmp_path: Path) -> None:
-        """Test that invalid target shows error."""
-        import os
+        result = runner.invoke(cli, ["upgrade", "config", "--force"])
 
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-        try:
-            # Create a file so we don't get "no files" error
-            prompt_file = tmp_path / "LOOP-PROMPT.md"
-            prompt_file.write_text("content")
+        assert result.exit_code == 0
+        lines = set(config_file.read_text().splitlines())
+        assert {"[learning]", "keep_diary = false"} <= lines
+
+    def test_upgrade_invalid_target(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that invalid target shows error."""
+        monkeypatch.chdir(tmp_path)
+        # Create a file so we don't get "no files" error
+        prompt_file = tmp_path / "LOOP-PROMPT.md"
+        prompt_file.write_text("content")
 
-            result = runner.invoke(app, ["upgrade", "invalid"])
+        result = runner.invoke(cli, ["upgrade", "invalid"])
 
-            assert result.exit_code == 1
-            assert "Unknown target" in result.output
-        finally:
-            os.chdir(original_cwd)
+        assert result.exit_code == 1
+        assert "Unknown target" in result.output
 
 
 class TestVersionParsing: